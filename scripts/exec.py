@@ -4,42 +4,72 @@ from __future__ import annotations
 
 import os
 import shutil
+import stat
 import subprocess
 import sys
-from pathlib import Path
 from typing import Sequence
 
 
-def _plugin_root() -> Path:
+_DEFAULT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _plugin_root() -> str:
     env_root = os.environ.get("CLAUDE_PLUGIN_ROOT")
     if env_root:
-        return Path(env_root).expanduser()
-    return Path(__file__).resolve().parents[1]
+        return os.path.expanduser(env_root) if env_root.startswith("~") else env_root
+    return _DEFAULT_ROOT
 
 
-def _validate_plugin_root(plugin_root: Path) -> bool:
-    if not plugin_root.exists():
+def _validate_plugin_root(plugin_root: str) -> bool:
+    try:
+        st = os.stat(plugin_root)
+    except OSError:
         print(f"Error: plugin root not found: {plugin_root}", file=sys.stderr)
         return False
-    if not plugin_root.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         print(f"Error: plugin root is not a directory: {plugin_root}", file=sys.stderr)
         return False
     return True
 
 
-def _venv_python(plugin_root: Path) -> Path | None:
-    venv_dir = plugin_root / ".venv"
+def _venv_python(plugin_root: str) -> str | None:
     if os.name == "nt":
-        candidate = venv_dir / "Scripts" / "python.exe"
+        candidate = os.path.join(plugin_root, ".venv", "Scripts", "python.exe")
     else:
-        candidate = venv_dir / "bin" / "python"
-    return candidate if candidate.exists() else None
+        candidate = os.path.join(plugin_root, ".venv", "bin", "python")
+    return candidate if os.path.isfile(candidate) else None
+
+
+def _venv_is_fresh(plugin_root: str) -> bool:
+    try:
+        venv_mtime = os.stat(os.path.join(plugin_root, ".venv")).st_mtime
+        for name in ("pyproject.toml", "uv.lock"):
+            try:
+                if os.stat(os.path.join(plugin_root, name)).st_mtime > venv_mtime:
+                    return False
+            except FileNotFoundError:
+                continue
+    except OSError:
+        return False
+    return True
+
+
+def _skip_uv(plugin_root: str) -> bool:
+    """Whether an existing .venv can be used without going through `uv run`.
 
+    Dependencies are still synced by scripts/setup.py (`uv sync`); this only
+    avoids uv's per-invocation sync bookkeeping on the hot path.
+    """
+    override = os.environ.get("CLAUDE_STT_SKIP_UV")
+    if override is not None:
+        return override.strip().lower() in ("1", "true", "yes", "on")
+    return _venv_is_fresh(plugin_root)
 
-def _resolve_python(plugin_root: Path) -> list[str] | None:
+
+def _resolve_python(plugin_root: str) -> list[str] | None:
     override = os.environ.get("CLAUDE_STT_PYTHON")
     if override:
-        if Path(override).exists():
+        if os.path.exists(override):
             return [override]
         print(
             f"Error: CLAUDE_STT_PYTHON not found: {override}",
@@ -47,21 +77,37 @@ def _resolve_python(plugin_root: Path) -> list[str] | None:
         )
         return None
 
+    venv_python = _venv_python(plugin_root)
+    if venv_python and _skip_uv(plugin_root):
+        return [venv_python]
+
     uv = shutil.which("uv")
     if uv:
-        return [uv, "run", "--directory", str(plugin_root), "python"]
+        return [uv, "run", "--directory", plugin_root, "python"]
 
-    venv_python = _venv_python(plugin_root)
     if venv_python:
-        return [str(venv_python)]
+        return [venv_python]
 
     return None
 
 
-def _run_command(command: list[str], plugin_root: Path) -> int:
-    env = os.environ.copy()
-    env.setdefault("CLAUDE_PLUGIN_ROOT", str(plugin_root))
-    return subprocess.call(command, cwd=str(plugin_root), env=env)
+def _run_command(command: list[str], plugin_root: str, wait: bool = False) -> int:
+    """Run command in plugin_root.
+
+    By default the current process is replaced via exec on POSIX so only one
+    interpreter stays resident. Pass wait=True to get the child's return code
+    instead; Windows always waits since exec there does not replace the process.
+    """
+    # Children inherit os.environ directly; no need to copy it.
+    os.environ.setdefault("CLAUDE_PLUGIN_ROOT", plugin_root)
+    if wait or os.name == "nt":
+        return subprocess.call(command, cwd=plugin_root)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.chdir(plugin_root)
+    os.execvp(command[0], command)
+    return 0  # pragma: no cover - execvp does not return
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import os
 import platform
 import shutil
+import stat
 import subprocess
 import sys
 import venv
@@ -13,11 +16,15 @@ from pathlib import Path
 from typing import Sequence
 
 
+_DEFAULT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
 def _get_plugin_root() -> Path:
     env_root = os.environ.get("CLAUDE_PLUGIN_ROOT")
     if env_root:
-        return Path(env_root).expanduser()
-    return Path(__file__).resolve().parents[1]
+        path = Path(env_root)
+        return path.expanduser() if env_root.startswith("~") else path
+    return _DEFAULT_ROOT
 
 
 def _print_error(message: str) -> None:
@@ -28,8 +35,13 @@ def _print_info(message: str) -> None:
     print(message)
 
 
+@functools.lru_cache(maxsize=1)
+def _platform_system() -> str:
+    return platform.system()
+
+
 def _get_install_hint() -> str:
-    system = platform.system()
+    system = _platform_system()
     if system == "Darwin":
         return "Install with: brew install python@3.12\nOr download from: https://www.python.org/downloads/"
     if system == "Linux":
@@ -57,14 +69,31 @@ def _run(cmd: list[str], cwd: Path) -> int:
     return subprocess.call(cmd, cwd=str(cwd))
 
 
+def _handoff(cmd: list[str], cwd: Path) -> int:
+    """Run the final setup step in place of this bootstrap process.
+
+    On POSIX the bootstrap interpreter is replaced via exec, so it doesn't sit
+    idle waiting on the child. Windows falls back to a regular subprocess.
+    """
+    if os.name == "nt":
+        return _run(cmd, cwd)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.chdir(cwd)
+    os.execvp(cmd[0], cmd)
+    return 0  # pragma: no cover - execvp does not return
+
+
 def _validate_plugin_root(plugin_root: Path) -> bool:
-    if not plugin_root.exists():
+    try:
+        st = os.stat(plugin_root)
+    except OSError:
         _print_error(f"Plugin root not found: {plugin_root}")
         return False
-    if not plugin_root.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         _print_error(f"Plugin root is not a directory: {plugin_root}")
         return False
-    if not (plugin_root / "src" / "claude_stt").exists():
+    if not os.path.exists(os.path.join(plugin_root, "src", "claude_stt")):
         _print_error("Expected claude-stt sources missing in plugin root.")
         return False
     return True
@@ -79,7 +108,7 @@ def _check_writable(plugin_root: Path) -> bool:
 
 def _platform_extras() -> list[str]:
     """Return platform-specific extras to install."""
-    system = platform.system()
+    system = _platform_system()
     if system == "Darwin":
         return ["macos", "menubar"]  # pyobjc + rumps for menu bar icon
     if system == "Windows":
@@ -88,13 +117,15 @@ def _platform_extras() -> list[str]:
 
 
 def _check_pip(python_path: Path) -> bool:
-    result = subprocess.run(
-        [str(python_path), "-m", "pip", "--version"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        return True
+    # Look for pip in the venv's site-packages rather than spawning
+    # `python -m pip --version` (POSIX: lib/pythonX.Y, Windows: Lib).
+    venv_root = python_path.parent.parent
+    for pattern in (
+        "lib/python*/site-packages/pip/__init__.py",
+        "Lib/site-packages/pip/__init__.py",
+    ):
+        if any(venv_root.glob(pattern)):
+            return True
     _print_error("pip is not available in this Python environment.")
     _print_error("Install pip (python -m ensurepip --upgrade) or use a Python build with pip.")
     return False
@@ -122,11 +153,35 @@ def _ensure_venv(plugin_root: Path) -> Path | None:
     return python_path if python_path.exists() else None
 
 
+def _install_fingerprint(plugin_root: Path, extra: str | None) -> str:
+    """Hash the inputs of `pip install .[extra]` to detect no-op reinstalls."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((plugin_root / "pyproject.toml").read_bytes())
+    digest.update(f"\0{extra or ''}\0".encode())
+    # pip copies the sources into site-packages, so source edits count too.
+    for path in sorted((plugin_root / "src" / "claude_stt").rglob("*.py")):
+        digest.update(f"{path.relative_to(plugin_root)}:{path.stat().st_mtime_ns}\0".encode())
+    return digest.hexdigest()
+
+
 def _pip_install(python_path: Path, plugin_root: Path, extra: str | None) -> int:
+    marker = plugin_root / ".venv" / ".claude-stt-installed"
+    try:
+        fingerprint = _install_fingerprint(plugin_root, extra)
+    except OSError:
+        fingerprint = None
+    if fingerprint is not None:
+        try:
+            if marker.read_text(encoding="utf-8").strip() == fingerprint:
+                _print_info("Dependencies already installed; skipping pip install.")
+                return 0
+        except OSError:
+            pass
+
     if not _check_pip(python_path):
         return 1
     package = f".[{extra}]" if extra else "."
-    return _run(
+    exit_code = _run(
         [
             str(python_path),
             "-m",
@@ -138,6 +193,12 @@ def _pip_install(python_path: Path, plugin_root: Path, extra: str | None) -> int
         ],
         plugin_root,
     )
+    if exit_code == 0 and fingerprint is not None:
+        try:
+            marker.write_text(fingerprint, encoding="utf-8")
+        except OSError:
+            pass
+    return exit_code
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -181,9 +242,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         _print_info("Using uv for dependency install.")
         if not args.skip_sync:
             sync_cmd = [uv, "sync", "--directory", str(plugin_root)]
-            if extras:
-                for item in extras:
-                    sync_cmd.extend(["--extra", item])
+            # uv only takes one extra per flag; keep a stable, deduplicated order.
+            for item in sorted(set(extras)):
+                sync_cmd.extend(["--extra", item])
             exit_code = _run(sync_cmd, plugin_root)
             if exit_code != 0:
                 _print_error("uv sync failed.")
@@ -199,7 +260,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             "claude_stt.setup",
             *passthrough,
         ]
-        return _run(cmd, plugin_root)
+        return _handoff(cmd, plugin_root)
 
     venv_python = _ensure_venv(plugin_root)
     if venv_python is None:
@@ -213,7 +274,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             return exit_code
 
     cmd = [str(venv_python), "-m", "claude_stt.setup", *passthrough]
-    return _run(cmd, plugin_root)
+    return _handoff(cmd, plugin_root)
 
 
 if __name__ == "__main__":
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from typing import Sequence
 
 from . import __version__
-from .daemon import main as daemon_main
-from .setup import main as setup_main
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -32,7 +31,34 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_DAEMON_COMMANDS = frozenset(("start", "stop", "status", "run"))
+
+
+def _dispatch(command: str, rest: list[str]) -> int:
+    # Defer heavy imports (audio, hotkeys, engines) until a command needs them.
+    if command == "setup":
+        from .setup import main as setup_main
+
+        return setup_main(rest)
+
+    from .daemon import main as daemon_main
+
+    if command == "daemon":
+        return daemon_main(rest)
+    return daemon_main([command, *rest])
+
+
 def main(argv: Sequence[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    # Common invocations skip building the argparse parser entirely.
+    if argv:
+        command = argv[0]
+        if command == "setup" or command in _DAEMON_COMMANDS:
+            return _dispatch(command, argv[1:])
+        if command == "daemon" and len(argv) > 1:
+            return _dispatch(command, argv[1:])
+
     parser = build_parser()
     args = parser.parse_args(argv)
 
@@ -40,16 +66,11 @@ def main(argv: Sequence[str] | None = None) -> int:
         print(__version__)
         return 0
 
-    if args.command == "setup":
-        return setup_main(list(args.args))
-
-    if args.command == "daemon":
-        if not args.args:
-            parser.print_help()
-            return 2
-        return daemon_main(list(args.args))
+    if args.command == "daemon" and not args.args:
+        parser.print_help()
+        return 2
 
-    return daemon_main([args.command, *args.args])
+    return _dispatch(args.command, list(args.args))
 
 
 if __name__ == "__main__":
@@ -1,28 +1,64 @@
 """Configuration management for claude-stt."""
 
+import functools
+import json
 import logging
 import os
 import platform
-import tempfile
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 from typing import Literal
 
-try:
-    import tomllib as tomli
-except ImportError:
-    try:
-        import tomli
-    except ImportError:
-        tomli = None
-
-try:
-    import tomli_w
-except ImportError:
-    tomli_w = None
+from . import __version__
 
 logger = logging.getLogger(__name__)
 
+# TOML modules are imported on first use; _UNSET means "not probed yet".
+_UNSET = object()
+_tomli = _UNSET
+_tomli_w = _UNSET
+
+
+def _get_tomli():
+    """Return the TOML reader module (tomllib or tomli), or None."""
+    global _tomli
+    if _tomli is _UNSET:
+        try:
+            import tomllib as module
+        except ImportError:
+            try:
+                import tomli as module
+            except ImportError:
+                module = None
+        _tomli = module
+    return _tomli
+
+
+def _get_tomli_w():
+    """Return the tomli_w module, or None."""
+    global _tomli_w
+    if _tomli_w is _UNSET:
+        try:
+            import tomli_w as module
+        except ImportError:
+            module = None
+        _tomli_w = module
+    return _tomli_w
+
+
+_MODES = frozenset(("push-to-talk", "toggle"))
+_ENGINES = frozenset(("moonshine", "whisper"))
+_OUTPUT_MODES = frozenset(("injection", "clipboard", "auto"))
+_MOONSHINE_KNOWN = frozenset(("moonshine/tiny", "moonshine/base"))
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
+# Resolved config dir/path, keyed by the CLAUDE_STT_CONFIG_DIR value they came from.
+_CONFIG_DIR_CACHE: "tuple[str | None, Path] | None" = None
+_CONFIG_PATH_CACHE: "tuple[Path, Path] | None" = None
+
+# Last parsed config keyed by (path, mtime_ns, size); see Config.load.
+_CONFIG_CACHE: "tuple[tuple[Path, int, int], Config] | None" = None
+
 
 @dataclass
 class Config:
@@ -54,10 +90,19 @@ class Config:
     @classmethod
     def get_config_dir(cls) -> Path:
         """Get the configuration directory path."""
-        override = os.environ.get("CLAUDE_STT_CONFIG_DIR")
+        global _CONFIG_DIR_CACHE
+        override = os.environ.get("CLAUDE_STT_CONFIG_DIR") or None
+        cached = _CONFIG_DIR_CACHE
+        if cached is not None and cached[0] == override:
+            return cached[1]
         if override:
-            return Path(override).expanduser()
-        return Path.home() / ".claude" / "plugins" / "claude-stt"
+            path = Path(override)
+            if override.startswith("~"):
+                path = path.expanduser()
+        else:
+            path = Path.home() / ".claude" / "plugins" / "claude-stt"
+        _CONFIG_DIR_CACHE = (override, path)
+        return path
 
     @classmethod
     def _legacy_config_path(cls) -> Path | None:
@@ -65,17 +110,31 @@ class Config:
         plugin_root = os.environ.get("CLAUDE_PLUGIN_ROOT")
         if not plugin_root:
             return None
-        legacy_path = Path(plugin_root).expanduser() / "config.toml"
+        root = Path(plugin_root)
+        if plugin_root.startswith("~"):
+            root = root.expanduser()
+        legacy_path = root / "config.toml"
         return legacy_path if legacy_path.exists() else None
 
     @classmethod
     def get_config_path(cls) -> Path:
         """Get the configuration file path."""
-        return cls.get_config_dir() / "config.toml"
+        global _CONFIG_PATH_CACHE
+        config_dir = cls.get_config_dir()
+        cached = _CONFIG_PATH_CACHE
+        if cached is not None and cached[0] is config_dir:
+            return cached[1]
+        path = config_dir / "config.toml"
+        _CONFIG_PATH_CACHE = (config_dir, path)
+        return path
 
     @classmethod
     def load(cls) -> "Config":
-        """Load configuration from file, or return defaults."""
+        """Load configuration from file, or return defaults.
+
+        The returned config is already validated; callers don't need to call
+        validate() on it again.
+        """
         config_path = cls.get_config_path()
         legacy_path = None
         if not config_path.exists():
@@ -83,12 +142,29 @@ class Config:
             if legacy_path is None:
                 return cls()
 
+        global _CONFIG_CACHE
+        source_path = legacy_path or config_path
+        cache_key = None
+        if legacy_path is None:
+            try:
+                st = os.stat(source_path)
+                cache_key = (source_path, st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+        if cache_key is not None:
+            if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == cache_key:
+                return replace(_CONFIG_CACHE[1])
+            cached = _read_config_cache(cache_key)
+            if cached is not None:
+                _CONFIG_CACHE = (cache_key, replace(cached))
+                return cached
+
+        tomli = _get_tomli()
         if tomli is None:
             logger.warning("tomli not installed; using default config")
             return cls().validate()
 
         try:
-            source_path = legacy_path or config_path
             with open(source_path, "rb") as f:
                 data = tomli.load(f)
 
@@ -109,7 +185,10 @@ class Config:
                 menu_bar=stt_config.get("menu_bar", cls.menu_bar),
             )
             config = config.validate()
-            if legacy_path and tomli_w is not None:
+            if cache_key is not None:
+                _CONFIG_CACHE = (cache_key, replace(config))
+                _write_config_cache(cache_key, config)
+            if legacy_path and _get_tomli_w() is not None:
                 try:
                     config.save()
                     logger.info(
@@ -125,6 +204,7 @@ class Config:
 
     def save(self) -> bool:
         """Save configuration to file."""
+        tomli_w = _get_tomli_w()
         if tomli_w is None:
             logger.warning("tomli-w not installed; config not saved")
             return False
@@ -148,26 +228,20 @@ class Config:
             }
         }
 
-        temp_file = None
+        temp_file = f"{config_path}.tmp.{os.getpid()}"
         try:
-            with tempfile.NamedTemporaryFile(
-                "wb",
-                delete=False,
-                dir=str(config_path.parent),
-            ) as handle:
-                temp_file = Path(handle.name)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with os.fdopen(fd, "wb") as handle:
                 tomli_w.dump(data, handle)
             os.replace(temp_file, config_path)
             return True
         except Exception:
             logger.exception("Failed to save config")
+            try:
+                os.unlink(temp_file)
+            except OSError:
+                pass
             return False
-        finally:
-            if temp_file and temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except OSError:
-                    pass
 
     def validate(self) -> "Config":
         """Validate and normalize configuration values."""
@@ -175,18 +249,18 @@ class Config:
             logger.warning("Invalid hotkey; defaulting to 'ctrl+shift+space'")
             self.hotkey = "ctrl+shift+space"
 
-        if self.mode not in ("push-to-talk", "toggle"):
+        if not isinstance(self.mode, str) or self.mode not in _MODES:
             logger.warning("Invalid mode '%s'; defaulting to 'toggle'", self.mode)
             self.mode = "toggle"
 
-        if self.engine not in ("moonshine", "whisper"):
+        if not isinstance(self.engine, str) or self.engine not in _ENGINES:
             logger.warning("Invalid engine '%s'; defaulting to 'moonshine'", self.engine)
             self.engine = "moonshine"
 
         if not isinstance(self.moonshine_model, str) or not self.moonshine_model.strip():
             logger.warning("Invalid moonshine_model; defaulting to 'moonshine/base'")
             self.moonshine_model = "moonshine/base"
-        elif self.moonshine_model not in ("moonshine/tiny", "moonshine/base"):
+        elif self.moonshine_model not in _MOONSHINE_KNOWN:
             logger.warning(
                 "Unknown moonshine_model '%s'; using as provided",
                 self.moonshine_model,
@@ -196,18 +270,13 @@ class Config:
             logger.warning("Invalid whisper_model; defaulting to 'medium'")
             self.whisper_model = "medium"
 
-        if self.output_mode not in ("injection", "clipboard", "auto"):
+        if not isinstance(self.output_mode, str) or self.output_mode not in _OUTPUT_MODES:
             logger.warning("Invalid output_mode '%s'; defaulting to 'auto'", self.output_mode)
             self.output_mode = "auto"
 
         if not isinstance(self.sound_effects, bool):
             if isinstance(self.sound_effects, str):
-                self.sound_effects = self.sound_effects.strip().lower() in (
-                    "1",
-                    "true",
-                    "yes",
-                    "on",
-                )
+                self.sound_effects = self.sound_effects.strip().lower() in _TRUTHY
             else:
                 self.sound_effects = bool(self.sound_effects)
 
@@ -234,12 +303,7 @@ class Config:
 
         if not isinstance(self.menu_bar, bool):
             if isinstance(self.menu_bar, str):
-                self.menu_bar = self.menu_bar.strip().lower() in (
-                    "1",
-                    "true",
-                    "yes",
-                    "on",
-                )
+                self.menu_bar = self.menu_bar.strip().lower() in _TRUTHY
             else:
                 self.menu_bar = bool(self.menu_bar)
 
@@ -263,15 +327,75 @@ class Config:
             return False
 
 
+def reset_config_dir_cache() -> None:
+    """Forget the memoized config dir/path (e.g. after HOME changes in tests)."""
+    global _CONFIG_DIR_CACHE, _CONFIG_PATH_CACHE
+    _CONFIG_DIR_CACHE = None
+    _CONFIG_PATH_CACHE = None
+
+
+def _config_cache_file(config_path: Path) -> Path:
+    return config_path.with_name("config.cache.json")
+
+
+def _read_config_cache(cache_key: tuple[Path, int, int]) -> Config | None:
+    """Return the validated config cached for this exact config.toml, if any."""
+    config_path, mtime_ns, size = cache_key
+    try:
+        with open(_config_cache_file(config_path), "rb") as f:
+            payload = json.load(f)
+        # Validation rules can change between releases, so a cache written by
+        # another version is ignored.
+        if (
+            payload.get("version") != __version__
+            or payload.get("source") != str(config_path)
+            or payload.get("mtime_ns") != mtime_ns
+            or payload.get("size") != size
+        ):
+            return None
+        return Config(**payload["config"])
+    except Exception:
+        return None
+
+
+def _write_config_cache(cache_key: tuple[Path, int, int], config: Config) -> None:
+    """Persist a validated config so later processes can skip the TOML parse."""
+    config_path, mtime_ns, size = cache_key
+    cache_file = _config_cache_file(config_path)
+    temp_file = f"{cache_file}.tmp.{os.getpid()}"
+    payload = {
+        "version": __version__,
+        "source": str(config_path),
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "config": asdict(config),
+    }
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(temp_file, cache_file)
+    except Exception:
+        logger.debug("Failed to write config cache", exc_info=True)
+        try:
+            os.unlink(temp_file)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
 def get_platform() -> str:
     """Get the current platform identifier."""
-    return {
-        "Darwin": "macos",
-        "Linux": "linux",
-        "Windows": "windows",
-    }.get(platform.system(), "unknown")
+    match platform.system():
+        case "Darwin":
+            return "macos"
+        case "Linux":
+            return "linux"
+        case "Windows":
+            return "windows"
+    return "unknown"
 
 
+@functools.lru_cache(maxsize=1)
 def is_wayland() -> bool:
     """Check if running under Wayland on Linux."""
     if get_platform() != "linux":
@@ -279,6 +403,7 @@ def is_wayland() -> bool:
     return os.environ.get("XDG_SESSION_TYPE") == "wayland"
 
 
+@functools.lru_cache(maxsize=1)
 def is_wsl() -> bool:
     """Check if running under Windows Subsystem for Linux."""
     if get_platform() != "linux":
@@ -1,6 +1,7 @@
 """Main daemon process for claude-stt."""
 
 import argparse
+import functools
 import json
 import logging
 import os
@@ -22,26 +23,88 @@ from .daemon_service import STTDaemon
 
 logger = logging.getLogger(__name__)
 
+# Parsed PID file keyed by (path, mtime_ns, size), and recent process command
+# lookups (pid -> (monotonic timestamp, command)); see _read_pid_file and
+# _get_process_command.
+_PID_FILE_CACHE: Optional[tuple[tuple[str, int, int], dict]] = None
+_PROCESS_COMMAND_CACHE: dict[int, tuple[float, Optional[str]]] = {}
+_PROCESS_COMMAND_TTL = 1.0
+
+# (config_dir, pid_file) for the last config dir seen; see get_pid_file.
+_PID_FILE_PATH_CACHE: Optional[tuple[Path, Path]] = None
+
 
 def get_pid_file() -> Path:
     """Get the PID file path."""
-    return Config.get_config_dir() / "daemon.pid"
+    global _PID_FILE_PATH_CACHE
+    config_dir = Config.get_config_dir()
+    cached = _PID_FILE_PATH_CACHE
+    # get_config_dir returns the same object until its override changes.
+    if cached is not None and cached[0] is config_dir:
+        return cached[1]
+    pid_file = config_dir / "daemon.pid"
+    _PID_FILE_PATH_CACHE = (config_dir, pid_file)
+    return pid_file
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_ROOT = Path(os.path.dirname(os.path.dirname(_PACKAGE_DIR)))
 
 
 def _get_plugin_root() -> Path:
     env_root = os.environ.get("CLAUDE_PLUGIN_ROOT")
     if env_root:
         return Path(env_root)
-    return Path(__file__).resolve().parents[2]
+    return _DEFAULT_ROOT
+
+
+def _invalidate_pid_caches() -> None:
+    global _PID_FILE_CACHE
+    _PID_FILE_CACHE = None
+    _PROCESS_COMMAND_CACHE.clear()
+
+
+def _remove_pid_file() -> None:
+    get_pid_file().unlink(missing_ok=True)
+    _invalidate_pid_caches()
 
 
 def _read_pid_file() -> Optional[dict]:
+    global _PID_FILE_CACHE
     pid_file = get_pid_file()
-    if not pid_file.exists():
+    try:
+        st = pid_file.stat()
+    except OSError:
         return None
+    cache_key = (str(pid_file), st.st_mtime_ns, st.st_size)
+    if _PID_FILE_CACHE is not None and _PID_FILE_CACHE[0] == cache_key:
+        return dict(_PID_FILE_CACHE[1])
+
+    data = _parse_pid_file(pid_file)
+    _PID_FILE_CACHE = (cache_key, dict(data)) if data is not None else None
+    return data
+
+
+def _read_small_file(path: str) -> bytes:
+    """Read a small file with raw os calls, skipping the io stack."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
 
+def _parse_pid_file(pid_file: Path) -> Optional[dict]:
     try:
-        raw = pid_file.read_text(encoding="utf-8", errors="replace").strip()
+        raw = _read_small_file(str(pid_file)).decode("utf-8", errors="replace").strip()
+    except FileNotFoundError:
+        return None
     except Exception:
         logger.debug("Failed to read PID file", exc_info=True)
         return None
@@ -63,15 +126,17 @@ def _read_pid_file() -> Optional[dict]:
 
 
 def _write_pid_file(pid: int) -> None:
+    pid_file = get_pid_file()
     data = {
         "pid": pid,
         "command": " ".join(sys.argv),
         "created_at": time.time(),
-        "config_dir": str(Config.get_config_dir()),
+        "config_dir": str(pid_file.parent),
+        "exe": os.path.realpath(sys.executable),
     }
-    pid_file = get_pid_file()
     pid_file.parent.mkdir(parents=True, exist_ok=True)
     temp_file = None
+    replaced = False
     try:
         with tempfile.NamedTemporaryFile(
             "w",
@@ -82,17 +147,18 @@ def _write_pid_file(pid: int) -> None:
             temp_file = Path(handle.name)
             handle.write(json.dumps(data))
         os.replace(temp_file, pid_file)
+        replaced = True
+        _invalidate_pid_caches()
     finally:
-        if temp_file and temp_file.exists():
+        if temp_file is not None and not replaced:
             try:
-                temp_file.unlink()
+                temp_file.unlink(missing_ok=True)
             except OSError:
                 pass
 
 
 def is_daemon_running() -> bool:
     """Check if daemon is running."""
-    pid_file = get_pid_file()
     data = _read_pid_file()
     if not data:
         return False
@@ -100,11 +166,13 @@ def is_daemon_running() -> bool:
     try:
         pid = int(data["pid"])
         if pid <= 0:
-            pid_file.unlink(missing_ok=True)
+            _remove_pid_file()
             return False
         if not _pid_exists(pid):
-            pid_file.unlink(missing_ok=True)
+            _remove_pid_file()
             return False
+        if _verify_pid_identity(pid, data):
+            return True
         command = _get_process_command(pid)
         if command is None:
             return True
@@ -112,28 +180,88 @@ def is_daemon_running() -> bool:
             logger.warning(
                 "PID file points to non-claude-stt process; removing stale PID file"
             )
-            pid_file.unlink(missing_ok=True)
+            _remove_pid_file()
             return False
         return True
     except PermissionError:
         return True
     except (ValueError, OSError):
-        pid_file.unlink(missing_ok=True)
+        _remove_pid_file()
         return False
 
 
+def _verify_pid_identity(pid: int, data: dict) -> Optional[bool]:
+    """Cheaply confirm pid is the interpreter that wrote the PID file.
+
+    Compares /proc/<pid>/exe with the recorded executable and checks that the
+    process started before the PID file was written (so a recycled PID fails).
+    Returns True when confirmed and None when it can't tell, in which case the
+    caller falls back to inspecting the command line.
+    """
+    exe = data.get("exe")
+    created_at = data.get("created_at")
+    if not isinstance(exe, str) or not isinstance(created_at, (int, float)):
+        return None
+    if not os.path.isdir("/proc/self"):
+        return None
+    try:
+        if os.readlink(f"/proc/{pid}/exe") != exe:
+            return None
+        started_at = _linux_process_start_time(pid)
+    except (OSError, ValueError, IndexError):
+        return None
+    # Boot time has whole-second resolution, so allow a second of slack.
+    if started_at > created_at + 1.0:
+        return None
+    return True
+
+
+def _linux_process_start_time(pid: int) -> float:
+    raw = _read_small_file(f"/proc/{pid}/stat").decode("ascii", errors="replace")
+    # Fields after the parenthesised comm start at field 3; starttime is field 22.
+    fields = raw[raw.rindex(")") + 2 :].split()
+    ticks = int(fields[19])
+    return _linux_boot_time() + ticks / os.sysconf("SC_CLK_TCK")
+
+
+@functools.lru_cache(maxsize=1)
+def _linux_boot_time() -> float:
+    for line in _read_small_file("/proc/stat").decode("ascii", errors="replace").splitlines():
+        if line.startswith("btime "):
+            return float(line.split()[1])
+    raise ValueError("btime missing from /proc/stat")
+
+
 def _get_process_command(pid: int) -> Optional[str]:
+    """Return the command line for pid, reusing lookups from the last second."""
+    now = time.monotonic()
+    cached = _PROCESS_COMMAND_CACHE.get(pid)
+    if cached is not None and now - cached[0] < _PROCESS_COMMAND_TTL:
+        return cached[1]
+    command = _query_process_command(pid)
+    _PROCESS_COMMAND_CACHE[pid] = (now, command)
+    return command
+
+
+def _query_process_command(pid: int) -> Optional[str]:
     if os.name == "nt":
         return _get_windows_process_command(pid)
 
-    proc_cmdline = Path(f"/proc/{pid}/cmdline")
-    if proc_cmdline.exists():
+    if os.path.isdir("/proc/self"):
+        # procfs is mounted: a missing /proc/<pid> means the process is gone,
+        # so there's no point asking ps.
+        if not os.path.isdir(f"/proc/{pid}"):
+            return None
         try:
-            raw = proc_cmdline.read_text(encoding="utf-8", errors="replace")
+            raw = _read_small_file(f"/proc/{pid}/cmdline").decode("utf-8", errors="replace")
             command = " ".join(part for part in raw.split("\x00") if part)
             return command or None
         except Exception:
             logger.debug("Failed to read /proc cmdline", exc_info=True)
+    elif sys.platform == "darwin":
+        command = _macos_process_command(pid)
+        if command:
+            return command
 
     result = subprocess.run(
         ["ps", "-p", str(pid), "-o", "command="],
@@ -147,7 +275,122 @@ def _get_process_command(pid: int) -> Optional[str]:
     return command or None
 
 
+def _macos_process_command(pid: int) -> Optional[str]:
+    """Read a process's argv via sysctl(KERN_PROCARGS2) instead of forking ps.
+
+    Returns None on any failure so the caller can fall back to ps.
+    """
+    try:
+        import ctypes
+
+        CTL_KERN = 1
+        KERN_ARGMAX = 8
+        KERN_PROCARGS2 = 49
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        argmax = ctypes.c_int(0)
+        size = ctypes.c_size_t(ctypes.sizeof(argmax))
+        mib = (ctypes.c_int * 2)(CTL_KERN, KERN_ARGMAX)
+        if libc.sysctl(mib, 2, ctypes.byref(argmax), ctypes.byref(size), None, 0) != 0:
+            return None
+
+        buffer = ctypes.create_string_buffer(argmax.value)
+        size = ctypes.c_size_t(argmax.value)
+        mib = (ctypes.c_int * 3)(CTL_KERN, KERN_PROCARGS2, pid)
+        if libc.sysctl(mib, 3, buffer, ctypes.byref(size), None, 0) != 0:
+            return None
+
+        # Layout: int argc, exec path, NUL padding, then argc NUL-terminated args.
+        raw = buffer.raw[: size.value]
+        argc = int.from_bytes(raw[:4], sys.byteorder)
+        pos = raw.find(b"\x00", 4)
+        if pos < 0:
+            return None
+        while pos < len(raw) and raw[pos] == 0:
+            pos += 1
+        args = raw[pos:].split(b"\x00")[:argc]
+        command = " ".join(arg.decode("utf-8", errors="replace") for arg in args if arg)
+        return command or None
+    except Exception:
+        logger.debug("sysctl KERN_PROCARGS2 lookup failed", exc_info=True)
+        return None
+
+
 def _get_windows_process_command(pid: int) -> Optional[str]:
+    command = _windows_native_process_command(pid)
+    if command:
+        return command
+    return _windows_subprocess_process_command(pid)
+
+
+def _windows_native_process_command(pid: int) -> Optional[str]:
+    """Read a process command line in-process via NtQueryInformationProcess.
+
+    Uses ProcessCommandLineInformation (Windows 8.1+), which only needs
+    PROCESS_QUERY_LIMITED_INFORMATION. Returns None if anything fails so the
+    caller can fall back to wmic/PowerShell.
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _UnicodeString(ctypes.Structure):
+            _fields_ = [
+                ("Length", wintypes.USHORT),
+                ("MaximumLength", wintypes.USHORT),
+                ("Buffer", ctypes.c_void_p),
+            ]
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        PROCESS_COMMAND_LINE_INFORMATION = 60
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        ntdll = ctypes.WinDLL("ntdll")
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        ntdll.NtQueryInformationProcess.restype = ctypes.c_long
+        ntdll.NtQueryInformationProcess.argtypes = [
+            wintypes.HANDLE,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            wintypes.ULONG,
+            ctypes.POINTER(wintypes.ULONG),
+        ]
+
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            size = wintypes.ULONG(0)
+            # First call reports the required buffer size.
+            ntdll.NtQueryInformationProcess(
+                handle, PROCESS_COMMAND_LINE_INFORMATION, None, 0, ctypes.byref(size)
+            )
+            if not size.value:
+                return None
+            buffer = ctypes.create_string_buffer(size.value)
+            status = ntdll.NtQueryInformationProcess(
+                handle,
+                PROCESS_COMMAND_LINE_INFORMATION,
+                buffer,
+                size,
+                ctypes.byref(size),
+            )
+            if status < 0:
+                return None
+            value = _UnicodeString.from_buffer(buffer)
+            if not value.Buffer or not value.Length:
+                return None
+            return ctypes.wstring_at(value.Buffer, value.Length // 2).strip() or None
+        finally:
+            kernel32.CloseHandle(handle)
+    except Exception:
+        logger.debug("Native command line lookup failed", exc_info=True)
+        return None
+
+
+def _windows_subprocess_process_command(pid: int) -> Optional[str]:
     try:
         result = subprocess.run(
             ["wmic", "process", "where", f"ProcessId={pid}", "get", "CommandLine"],
@@ -224,19 +467,41 @@ def _windows_pid_exists(pid: int) -> bool:
         return False
 
 
-def _spawn_background() -> bool:
-    """Spawn daemon in background using subprocess (all platforms)."""
-    log_file = Config.get_config_dir() / "daemon.log"
+def get_log_file() -> Path:
+    """Get the log file background daemons write their output to."""
+    return Config.get_config_dir() / "daemon.log"
+
+
+def spawn_background(plugin_root: Optional[Path] = None, log_file: Optional[Path] = None) -> bool:
+    """Start the daemon as a background process and wait for it to come up.
+
+    Used by ``start --background`` and by setup.
+
+    Args:
+        plugin_root: Working directory for the daemon, and its
+            CLAUDE_PLUGIN_ROOT unless that is already set. Defaults to the
+            root this package was loaded from.
+        log_file: Where the daemon's stdout/stderr go; defaults to
+            get_log_file().
+
+    Returns:
+        True once the daemon reports it is running (within 3 seconds).
+    """
+    plugin_root = plugin_root or _DEFAULT_ROOT
+    log_file = log_file or get_log_file()
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    env = os.environ.copy()
-    env.setdefault("CLAUDE_PLUGIN_ROOT", str(_get_plugin_root()))
+    # Inherit the environment as-is (env=None) unless CLAUDE_PLUGIN_ROOT needs adding.
+    env = None
+    if "CLAUDE_PLUGIN_ROOT" not in os.environ:
+        env = {**os.environ, "CLAUDE_PLUGIN_ROOT": str(plugin_root)}
+    ready = _open_ready_pipe()
     python_exe = sys.executable
     if os.name == "nt":
         pythonw = Path(sys.executable).parent / "pythonw.exe"
         if pythonw.exists():
             python_exe = str(pythonw)
-    cmd = [python_exe, "-m", "claude_stt.daemon", "run"]
+    cmd = [python_exe, "-m", "claude_stt.daemon", "run", *_ready_fd_args(ready)]
 
     creationflags = 0
     if os.name == "nt":
@@ -248,6 +513,9 @@ def _spawn_background() -> bool:
         with open(log_file, "a", encoding="utf-8") as log_handle:
             subprocess.Popen(
                 cmd,
+                # `python -m` puts the cwd on sys.path; don't let whatever
+                # directory we were started from shadow the daemon's imports.
+                cwd=str(plugin_root),
                 env=env,
                 stdout=log_handle,
                 stderr=log_handle,
@@ -255,47 +523,121 @@ def _spawn_background() -> bool:
                 # Linux/X11 hotkeys fail if we detach into a new session.
                 start_new_session=(os.name != "nt" and platform.system() == "Darwin"),
                 creationflags=creationflags,
+                pass_fds=ready[1:] if ready is not None else (),
             )
-
-        for _ in range(30):
-            if is_daemon_running():
-                logger.info("Daemon started in background.")
-                return True
-            time.sleep(0.1)
-
-        logger.warning(
-            "Daemon did not start within 3 seconds. Check %s", log_file
-        )
-        return False
     except Exception:
         logger.exception("Failed to spawn background daemon")
+        _close_ready_pipe(ready)
         return False
 
+    return _wait_for_daemon_start(ready, 3.0)
+
+
+def _open_ready_pipe() -> Optional[tuple[int, int]]:
+    """Create the (read, write) pipe a spawned daemon reports readiness on.
+
+    Returns None where inheriting fds isn't supported (Windows); callers then
+    fall back to polling the PID file.
+    """
+    if os.name == "nt":
+        return None
+    try:
+        return os.pipe()
+    except OSError:
+        return None
+
+
+def _close_ready_pipe(ready: Optional[tuple[int, int]]) -> None:
+    if ready is None:
+        return
+    for fd in ready:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _ready_fd_args(ready: Optional[tuple[int, int]]) -> list[str]:
+    """Arguments telling a spawned ``run`` which fd to report readiness on."""
+    return [] if ready is None else ["--ready-fd", str(ready[1])]
+
+
+def _notify_ready(fd: Optional[int]) -> None:
+    """Signal the process that spawned this daemon through its ready pipe."""
+    if fd is None:
+        return
+    try:
+        try:
+            os.write(fd, b"1")
+        finally:
+            os.close(fd)
+    except OSError:
+        logger.debug("Could not signal readiness on fd %s", fd, exc_info=True)
+
+
+def _wait_for_daemon_start(ready: Optional[tuple[int, int]], timeout: float) -> bool:
+    """Wait until a just-spawned daemon is running; closes the ready pipe.
+
+    With a pipe this returns as soon as the child writes to it, or as soon
+    as the child exits (EOF) without doing so. Otherwise it polls the PID
+    file with backoff from 20ms up to 200ms.
+    """
+    if ready is not None:
+        import select
 
-def start_daemon(background: bool = False):
+        read_fd, write_fd = ready
+        # Drop our write end so the child exiting shows up as EOF.
+        os.close(write_fd)
+        try:
+            readable, _, _ = select.select([read_fd], [], [], timeout)
+            if readable and os.read(read_fd, 1):
+                return True
+        finally:
+            os.close(read_fd)
+        # The child exited early (possibly finding a daemon already running)
+        # or is still starting up.
+        return is_daemon_running()
+
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while not is_daemon_running():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+    return True
+
+
+def start_daemon(background: bool = False, ready_fd: Optional[int] = None):
     """Start the daemon.
 
     Args:
         background: If True, daemonize the process.
+        ready_fd: Pipe fd to write to once the daemon is registered, if the
+            spawning process passed one.
     """
     if is_daemon_running():
         logger.info("Daemon is already running.")
         return
 
     if background:
-        if _spawn_background():
+        if spawn_background():
+            logger.info("Daemon started in background.")
             return
+        logger.warning("Background daemon did not come up. Check %s", get_log_file())
         logger.warning(
             "Background spawn failed; running in foreground"
         )
 
     _write_pid_file(os.getpid())
+    _notify_ready(ready_fd)
 
     try:
         daemon = STTDaemon()
         daemon.run()
     finally:
-        get_pid_file().unlink(missing_ok=True)
+        _remove_pid_file()
 
 
 def toggle_recording():
@@ -332,15 +674,16 @@ def stop_daemon():
         logger.info("Daemon is not running.")
         return
 
-    pid_file = get_pid_file()
     try:
         pid = int(data["pid"])
-        command = _get_process_command(pid)
+        # A process that matches our own PID file needs no command-line check.
+        verified = _pid_exists(pid) and _verify_pid_identity(pid, data)
+        command = None if verified else _get_process_command(pid)
         if command is not None and not _pid_looks_like_claude_stt(pid):
             logger.warning(
                 "PID %s does not look like claude-stt; refusing to kill", pid
             )
-            pid_file.unlink(missing_ok=True)
+            _remove_pid_file()
             return
         if not _terminate_process(pid):
             logger.warning(
@@ -349,12 +692,8 @@ def stop_daemon():
             return
         logger.info("Sent stop signal to daemon (PID %s)", pid)
 
-        # Wait for it to stop
-        for _ in range(50):  # 5 seconds
-            time.sleep(0.1)
-            if not _pid_exists(pid):
-                logger.info("Daemon stopped.")
-                break
+        if _wait_for_exit(pid, 5.0):
+            logger.info("Daemon stopped.")
         else:
             logger.warning("Daemon did not stop gracefully, forcing...")
             _force_kill(pid)
@@ -366,9 +705,83 @@ def stop_daemon():
         return
     except (ValueError, OSError):
         logger.info("Daemon is not running.")
-        pid_file.unlink(missing_ok=True)
+        _remove_pid_file()
     else:
-        pid_file.unlink(missing_ok=True)
+        _remove_pid_file()
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Block until pid exits or timeout elapses; returns True if it exited."""
+    if os.name == "nt":
+        exited = _windows_wait_for_exit(pid, timeout)
+    elif hasattr(os, "pidfd_open"):
+        exited = _pidfd_wait_for_exit(pid, timeout)
+    else:
+        exited = None
+    if exited is not None:
+        return exited
+
+    # No waitable handle: poll with backoff from 5ms up to 100ms.
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    while _pid_exists(pid):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.1)
+    return True
+
+
+def _pidfd_wait_for_exit(pid: int, timeout: float) -> Optional[bool]:
+    """Wait on a pidfd (Linux 5.3+); None if pidfds aren't usable."""
+    import select
+
+    try:
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return None
+    try:
+        readable, _, _ = select.select([fd], [], [], timeout)
+        return bool(readable)
+    finally:
+        os.close(fd)
+
+
+def _windows_wait_for_exit(pid: int, timeout: float) -> Optional[bool]:
+    """Wait on a process handle; None if the process can't be opened."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        SYNCHRONIZE = 0x00100000
+        WAIT_OBJECT_0 = 0
+        WAIT_TIMEOUT = 0x102
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return None
+        try:
+            result = kernel32.WaitForSingleObject(handle, int(timeout * 1000))
+        finally:
+            kernel32.CloseHandle(handle)
+        if result == WAIT_OBJECT_0:
+            return True
+        if result == WAIT_TIMEOUT:
+            return False
+        return None
+    except Exception:
+        logger.debug("WaitForSingleObject failed", exc_info=True)
+        return None
 
 
 def _terminate_process(pid: int) -> bool:
@@ -420,7 +833,7 @@ def daemon_status():
     else:
         logger.info("Daemon is not running.")
 
-    config = Config.load().validate()
+    config = Config.load()
     logger.info("Config path: %s", Config.get_config_path())
     logger.info("Hotkey: %s", config.hotkey)
     logger.info("Mode: %s", config.mode)
@@ -487,6 +900,8 @@ def main(argv: Optional[list[str]] = None) -> int:
         default=default_log_level,
         help="Logging level (default: CLAUDE_STT_LOG_LEVEL or INFO).",
     )
+    # Internal: set by spawn_background; see _wait_for_daemon_start.
+    parser.add_argument("--ready-fd", type=int, help=argparse.SUPPRESS)
 
     args = parser.parse_args(argv)
     setup_logging(args.log_level)
@@ -499,7 +914,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         case "status":
             daemon_status()
         case "run":
-            start_daemon(background=False)
+            start_daemon(background=False, ready_fd=args.ready_fd)
         case "toggle":
             if not toggle_recording():
                 return 1
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
-import queue
+import math
+import os
+import select
 import signal
+import socket
 import threading
 import time
 from typing import Optional
@@ -18,9 +21,164 @@ from .errors import EngineError, HotkeyError, RecorderError
 from .hotkey import HotkeyListener
 from .keyboard import output_text
 from .recorder import AudioRecorder, RecorderConfig
-from .sounds import play_sound
+from .sounds import play_sound, preload_sounds
 from .window import get_active_window, WindowInfo
 
+# Idle wait for the headless loop. POSIX signals interrupt its select(), so it
+# can block indefinitely; on Windows Ctrl+C is only seen once the wait returns.
+_IDLE_WAIT_SECONDS: Optional[float] = None if os.name != "nt" else 1.0
+# Warning sound plays this many seconds before the max recording time.
+_MAX_RECORDING_WARNING_SECONDS = 30
+# Recycled max-length audio buffers kept between recordings.
+_AUDIO_POOL_SIZE = 2
+# Level reported for silent or empty audio (an RMS floor of 1e-10).
+_SILENCE_DB = -200.0
+
+
+def _audio_level_db(audio: np.ndarray) -> float:
+    """RMS level of audio in dBFS.
+
+    np.dot reduces in a single pass without materialising audio**2, and the
+    scalar log goes through math rather than a numpy ufunc. The level is taken
+    from the mean square (10*log10) so no square root is needed.
+    """
+    if not len(audio):
+        return _SILENCE_DB
+    if audio.dtype.kind != "f":
+        # Integer PCM would overflow in np.dot; scale to [-1, 1] floats first.
+        full_scale = float(np.iinfo(audio.dtype).max) + 1.0
+        audio = audio.astype(np.float32) / np.float32(full_scale)
+    mean_square = float(np.dot(audio, audio)) / len(audio)
+    return 10.0 * math.log10(mean_square) if mean_square > 1e-20 else _SILENCE_DB
+
+
+class _SpscRing:
+    """Bounded single-producer/single-consumer ring buffer.
+
+    Slot and index stores are atomic under the GIL, so push/pop take no lock;
+    callers must make sure only one thread pushes at a time. The consumer
+    sleeps on an Event instead of polling.
+    """
+
+    def __init__(self, capacity: int):
+        self._size = capacity + 1
+        self._buf: list[object] = [None] * self._size
+        self._head = 0  # next slot to write (producer only)
+        self._tail = 0  # next slot to read (consumer only)
+        self._ready = threading.Event()
+        self._closed = False
+
+    def push(self, item: object) -> bool:
+        """Append item; returns False if the ring is full."""
+        head = self._head
+        next_head = (head + 1) % self._size
+        if next_head == self._tail:
+            return False
+        self._buf[head] = item
+        self._head = next_head
+        self._ready.set()
+        return True
+
+    def pop(self) -> Optional[object]:
+        """Block for the next item; returns None once the ring is closed and drained."""
+        while True:
+            tail = self._tail
+            if tail != self._head:
+                item = self._buf[tail]
+                self._buf[tail] = None
+                self._tail = (tail + 1) % self._size
+                return item
+            if self._closed:
+                return None
+            self._ready.clear()
+            # Re-check after clearing so a push racing with clear() isn't missed.
+            if self._tail == self._head and not self._closed:
+                self._ready.wait()
+
+    def pop_all(self) -> list[object]:
+        """Block for the next item, then take everything else already queued.
+
+        Items queued before close() are still returned; an empty list means
+        the ring is closed and drained.
+        """
+        first = self.pop()
+        if first is None:
+            return []
+        items = [first]
+        tail = self._tail
+        while tail != self._head:
+            items.append(self._buf[tail])
+            self._buf[tail] = None
+            tail = (tail + 1) % self._size
+            self._tail = tail
+        return items
+
+    def close(self) -> None:
+        """Wake the consumer; pop() returns None once the queue is drained."""
+        self._closed = True
+        self._ready.set()
+
+
+class _Waker:
+    """Self-pipe the headless loop sleeps on.
+
+    wake() only writes a byte to a socket, so unlike threading.Event.set() it
+    takes no lock and is safe to call from signal handlers as well as from
+    other threads. A socketpair is used because Windows can't select() on
+    pipes. The sockets are only created by open(), when a loop will wait on
+    them; until then wake() does nothing.
+    """
+
+    def __init__(self):
+        self._recv: Optional[socket.socket] = None
+        self._send: Optional[socket.socket] = None
+
+    def open(self) -> None:
+        if self._recv is not None:
+            return
+        recv, send = socket.socketpair()
+        recv.setblocking(False)
+        send.setblocking(False)
+        self._send = send
+        self._recv = recv
+
+    def wake(self) -> None:
+        send = self._send
+        if send is None:
+            return
+        try:
+            send.send(b"\0")
+        except OSError:
+            # Buffer full (a wakeup is already pending) or already closed.
+            pass
+
+    def clear(self) -> None:
+        """Discard pending wakeups."""
+        recv = self._recv
+        if recv is None:
+            return
+        try:
+            while recv.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Block until woken or timeout; returns True if woken."""
+        try:
+            ready, _, _ = select.select([self._recv], [], [], timeout)
+        except (OSError, TypeError, ValueError):
+            # Closed (or never opened) while waiting.
+            return True
+        return bool(ready)
+
+    def close(self) -> None:
+        recv, send = self._recv, self._send
+        self._recv = self._send = None
+        for sock in (recv, send):
+            if sock is not None:
+                sock.close()
+
 
 class STTDaemon:
     """Main daemon that coordinates all STT components."""
@@ -31,7 +189,12 @@ class STTDaemon:
         Args:
             config: Configuration, or load from file if None.
         """
-        self.config = (config or Config.load()).validate()
+        # Config.load() already validates; only caller-built configs need it.
+        self.config = config.validate() if config is not None else Config.load()
+        # Hot-path copies of config fields; the config isn't changed after init.
+        self._sample_rate = self.config.sample_rate
+        self._max_recording_seconds = self.config.max_recording_seconds
+        self._sound_effects = bool(self.config.sound_effects)
         self._running = False
         self._recording = False
 
@@ -41,14 +204,28 @@ class STTDaemon:
         self._hotkey: Optional[HotkeyListener] = None
 
         # Recording state
-        self._record_start_time: float = 0
+        self._record_start_time: float = 0.0  # time.monotonic()
+        # When to play the "almost at max" warning; cleared once it fires.
+        self._warning_deadline: Optional[float] = None
+        # Set from the audio thread once the recorder has captured the
+        # maximum length; see _on_recorder_full.
+        self._limit_reached = False
         self._original_window: Optional[WindowInfo] = None
         # Threading
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
-        self._transcribe_queue: "queue.Queue[Optional[tuple[object, Optional[WindowInfo]]]]" = (
-            queue.Queue(maxsize=2)
-        )
+        # Wakes the headless loop when recording starts/stops or on shutdown.
+        self._waker = _Waker()
+        # Set by the SIGINT/SIGTERM and SIGUSR1 handlers; the main loop does
+        # the actual work in _handle_signals().
+        self._shutdown_requested = False
+        self._toggle_requested = False
+        # Items are (audio, pooled_buffer, window_info); pushes happen under self._lock.
+        self._transcribe_queue = _SpscRing(2)
+        self._audio_pool: list[np.ndarray] = []
+        self._audio_pool_lock = threading.Lock()
+        # Pooled buffer the current recording is written into, if any.
+        self._recording_buffer: Optional[np.ndarray] = None
         self._transcribe_thread: Optional[threading.Thread] = None
         self._logger = logging.getLogger(__name__)
 
@@ -76,6 +253,7 @@ class STTDaemon:
             )
             if not self._recorder.is_available():
                 raise RecorderError("No audio input device available")
+            self._recorder.on_full = self._on_recorder_full
 
             # Log audio device
             try:
@@ -105,6 +283,8 @@ class STTDaemon:
             self._logger.error("%s", exc)
             return False
 
+        if self.config.sound_effects:
+            preload_sounds()
         self._start_transcription_worker()
         return True
 
@@ -112,6 +292,11 @@ class STTDaemon:
         if self._transcribe_thread is not None:
             return
 
+        if not getattr(self._engine, "releases_gil", True):
+            self._logger.warning(
+                "Engine %s holds the GIL while transcribing; hotkeys may lag during decode",
+                type(self._engine).__name__,
+            )
         self._transcribe_thread = threading.Thread(
             target=self._transcribe_worker,
             name="claude-stt-transcribe",
@@ -119,116 +304,211 @@ class STTDaemon:
         )
         self._transcribe_thread.start()
 
-    def _transcribe_worker(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                item = self._transcribe_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
+    def _acquire_buffer(self) -> Optional[np.ndarray]:
+        """Get a pooled buffer large enough for a max-length recording."""
+        size = self._recorder.max_samples if self._recorder else None
+        if not size:
+            return None
+        with self._audio_pool_lock:
+            while self._audio_pool:
+                buffer = self._audio_pool.pop()
+                if len(buffer) == size:
+                    return buffer
+        return np.empty(size, dtype=np.float32)
+
+    def _release_buffer(self, buffer: Optional[np.ndarray]) -> None:
+        if buffer is None:
+            return
+        with self._audio_pool_lock:
+            if len(self._audio_pool) < _AUDIO_POOL_SIZE:
+                self._audio_pool.append(buffer)
 
-            if item is None:
+    def _transcribe_worker(self) -> None:
+        # Blocks in pop_all() until work arrives; stop() closes the ring to end it.
+        while True:
+            items = self._transcribe_queue.pop_all()
+            if not items:
                 break
 
-            audio, window_info = item
-            if not self._engine:
-                continue
-
-            # Log audio level
-            rms = np.sqrt(np.mean(audio**2))
-            db = 20 * np.log10(max(rms, 1e-10))
-            self._logger.info("Transcribing audio (%d samples, %.1f dB)...", len(audio), db)
             try:
-                text = self._engine.transcribe(audio, self.config.sample_rate)
-            except Exception:
-                self._logger.exception("Transcription failed")
-                continue
-
-            text = text.strip()
-            if not text:
-                self._logger.info("No speech detected")
-                if self.config.sound_effects:
-                    play_sound("warning")
-                # Notify UI even on empty result
-                if self._ui_on_transcription_complete:
-                    try:
-                        self._ui_on_transcription_complete()
-                    except Exception:
-                        self._logger.debug("UI callback failed", exc_info=True)
-                continue
+                for audio, window_info in self._coalesce(items):
+                    self._transcribe_and_output(audio, window_info)
+            finally:
+                # audio may be a view of a buffer; only recycle them once we're done.
+                for _, buffer, _ in items:
+                    self._release_buffer(buffer)
+
+    def _coalesce(
+        self, items: list[tuple[np.ndarray, Optional[np.ndarray], Optional[WindowInfo]]]
+    ) -> list[tuple[np.ndarray, Optional[WindowInfo]]]:
+        """Merge back-to-back recordings aimed at the same window.
+
+        Recordings are joined only while the result fits in a max-length
+        recording, so the engine never sees more audio than it would otherwise.
+        """
+        max_samples = self._sample_rate * self._max_recording_seconds
+        batches: list[tuple[list[np.ndarray], Optional[WindowInfo]]] = []
+        batch_samples = 0
+        for audio, _, window_info in items:
+            if (
+                batches
+                and batches[-1][1] == window_info
+                and batch_samples + len(audio) <= max_samples
+            ):
+                batches[-1][0].append(audio)
+                batch_samples += len(audio)
+            else:
+                batches.append(([audio], window_info))
+                batch_samples = len(audio)
+        return [
+            (chunks[0] if len(chunks) == 1 else np.concatenate(chunks), window_info)
+            for chunks, window_info in batches
+        ]
+
+    def _transcribe_and_output(
+        self, audio: np.ndarray, window_info: Optional[WindowInfo]
+    ) -> None:
+        if not self._engine:
+            return
 
-            display_text = text[:100] + "..." if len(text) > 100 else text
-            self._logger.info("Transcribed: %s", display_text)
-            if not output_text(text, window_info, self.config):
-                self._logger.warning("Failed to output transcription")
-            # Notify UI
+        # Both engines work on contiguous float32; convert once here rather than
+        # per engine. Pooled recorder views already qualify and aren't copied.
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+
+        # Log audio level; skip the O(n) pass when INFO is filtered out.
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Transcribing audio (%d samples, %.1f dB)...", len(audio), _audio_level_db(audio)
+            )
+        try:
+            text = self._engine.transcribe(audio, self._sample_rate)
+        except Exception:
+            self._logger.exception("Transcription failed")
+            return
+
+        text = text.strip()
+        if not text:
+            self._logger.info("No speech detected")
+            if self._sound_effects:
+                play_sound("warning")
+            # Notify UI even on empty result
             if self._ui_on_transcription_complete:
                 try:
                     self._ui_on_transcription_complete()
                 except Exception:
                     self._logger.debug("UI callback failed", exc_info=True)
+            return
+
+        if self._logger.isEnabledFor(logging.INFO):
+            display_text = text[:100] + "..." if len(text) > 100 else text
+            self._logger.info("Transcribed: %s", display_text)
+        if not output_text(text, window_info, self.config):
+            self._logger.warning("Failed to output transcription")
+        # Notify UI
+        if self._ui_on_transcription_complete:
+            try:
+                self._ui_on_transcription_complete()
+            except Exception:
+                self._logger.debug("UI callback failed", exc_info=True)
 
     def _on_recording_start(self):
         """Called when recording should start."""
+        # Unlocked pre-check so redundant events (key repeat, double toggles)
+        # skip the lock; the locked re-check below is what makes it correct.
+        if self._recording:
+            return
         with self._lock:
             if self._recording:
                 return
 
             self._recording = True
-            self._record_start_time = time.time()
+            self._limit_reached = False
+            self._record_start_time = time.monotonic()
+            max_seconds = self._max_recording_seconds
+            if max_seconds > _MAX_RECORDING_WARNING_SECONDS:
+                self._warning_deadline = (
+                    self._record_start_time + max_seconds - _MAX_RECORDING_WARNING_SECONDS
+                )
+            else:
+                self._warning_deadline = None
 
             # Capture the active window
             self._original_window = get_active_window()
 
             # Start recording
-            if self._recorder and self._recorder.start():
-                self._logger.info("Recording started")
-                if self.config.sound_effects:
-                    play_sound("start")
-                # Notify UI
-                if self._ui_on_recording_start:
-                    try:
-                        self._ui_on_recording_start()
-                    except Exception:
-                        self._logger.debug("UI callback failed", exc_info=True)
+            # Record straight into a pooled buffer so stop() can hand it over
+            # without copying.
+            buffer = self._acquire_buffer() if self._recorder else None
+            started = bool(self._recorder and self._recorder.start(buffer=buffer))
+            if started:
+                self._recording_buffer = buffer
+                self._waker.wake()
             else:
-                self._logger.error("Audio recorder failed to start")
                 self._recording = False
-                if self.config.sound_effects:
-                    play_sound("error")
+                self._release_buffer(buffer)
+
+        # Sounds and UI updates can block; keep them out of the critical section.
+        if started:
+            self._logger.info("Recording started")
+            if self._sound_effects:
+                play_sound("start")
+            # Notify UI
+            if self._ui_on_recording_start:
+                try:
+                    self._ui_on_recording_start()
+                except Exception:
+                    self._logger.debug("UI callback failed", exc_info=True)
+        else:
+            self._logger.error("Audio recorder failed to start")
+            if self._sound_effects:
+                play_sound("error")
 
     def _on_recording_stop(self):
         """Called when recording should stop."""
         audio = None
         window_info = None
+        has_audio = queued = False
+        if not self._recording:
+            return
         with self._lock:
             if not self._recording:
                 return
 
             self._recording = False
-            elapsed = time.time() - self._record_start_time
+            self._warning_deadline = None
+            self._waker.wake()
+            elapsed = time.monotonic() - self._record_start_time
 
             # Stop recording
+            buffer = self._recording_buffer
+            self._recording_buffer = None
             if self._recorder:
                 audio = self._recorder.stop()
+            if buffer is not None and (audio is None or audio.base is not buffer):
+                self._release_buffer(buffer)
+                buffer = None
             window_info = self._original_window
-
-            self._logger.info("Recording stopped (%.1fs)", elapsed)
-            if self.config.sound_effects:
-                play_sound("stop")
-            # Notify UI
-            if self._ui_on_recording_stop:
-                try:
-                    self._ui_on_recording_stop()
-                except Exception:
-                    self._logger.debug("UI callback failed", exc_info=True)
-
-        # Transcribe outside the lock
-        if audio is not None and len(audio) > 0:
+            has_audio = audio is not None and len(audio) > 0
+            # Enqueue while still holding the lock so the ring has one producer.
+            queued = has_audio and self._transcribe_queue.push((audio, buffer, window_info))
+            if not queued:
+                self._release_buffer(buffer)
+
+        # Sounds, UI updates and transcription all happen outside the lock.
+        self._logger.info("Recording stopped (%.1fs)", elapsed)
+        if self._sound_effects:
+            play_sound("stop")
+        # Notify UI
+        if self._ui_on_recording_stop:
             try:
-                self._transcribe_queue.put_nowait((audio, window_info))
-            except queue.Full:
+                self._ui_on_recording_stop()
+            except Exception:
+                self._logger.debug("UI callback failed", exc_info=True)
+
+        if has_audio:
+            if not queued:
                 self._logger.warning("Dropping transcription; queue is full")
-        elif self.config.sound_effects:
+        elif self._sound_effects:
             play_sound("warning")
 
     def _check_max_recording_time(self) -> None:
@@ -236,17 +516,39 @@ class STTDaemon:
         if not self._recording:
             return
 
-        elapsed = time.time() - self._record_start_time
-        max_seconds = self.config.max_recording_seconds
-
-        # Warning at 30 seconds before max
-        if max_seconds > 30 and max_seconds - 30 <= elapsed < max_seconds - 29:
-            if self.config.sound_effects:
+        now = time.monotonic()
+        warning_deadline = self._warning_deadline
+        if warning_deadline is not None and now >= warning_deadline:
+            self._warning_deadline = None
+            if self._sound_effects:
                 play_sound("warning")
 
-        if elapsed >= max_seconds:
+        if self._limit_reached or now - self._record_start_time >= self._max_recording_seconds:
             self._on_recording_stop()
 
+    def _on_recorder_full(self) -> None:
+        """Audio-thread callback: the recorder has captured the maximum length.
+
+        Wakes whichever loop runs the max-recording check so the recording
+        stops now rather than at the next deadline, before the ring wraps
+        over the oldest audio.
+        """
+        self._limit_reached = True
+        self._waker.wake()
+        menubar = self._menubar_app
+        if menubar is not None:
+            menubar.request_check()
+
+    def _next_wakeup(self) -> Optional[float]:
+        """Seconds until the next max-recording deadline, or the idle wait."""
+        if not self._recording:
+            return _IDLE_WAIT_SECONDS
+
+        deadline = self._record_start_time + self._max_recording_seconds
+        if self._warning_deadline is not None:
+            deadline = min(deadline, self._warning_deadline)
+        return max(0.05, deadline - time.monotonic())
+
     def run(self):
         """Run the daemon main loop."""
         self._logger.info("claude-stt daemon starting...")
@@ -272,25 +574,22 @@ class STTDaemon:
 
         self._running = True
 
-        # Handle shutdown signals
+        # Handle shutdown signals. The handler runs on the main thread between
+        # bytecodes, possibly while it holds a lock (an Event's, or self._lock),
+        # so it only records the request and wakes the loop that acts on it.
         def shutdown(signum, frame):
-            self._logger.info("Shutting down...")
-            self._running = False
-            # If running with menubar, need to quit rumps event loop
-            if self._menubar_app is not None:
-                try:
-                    import rumps
-                    rumps.quit_application()
-                except Exception:
-                    pass
+            self._shutdown_requested = True
+            self._waker.wake()
+            menubar = self._menubar_app
+            if menubar is not None:
+                menubar.request_check()
 
         def toggle_recording(signum, frame):
-            if self._recording:
-                self._logger.info("SIGUSR1: stopping recording")
-                self._on_recording_stop()
-            else:
-                self._logger.info("SIGUSR1: starting recording")
-                self._on_recording_start()
+            self._toggle_requested = True
+            self._waker.wake()
+            menubar = self._menubar_app
+            if menubar is not None:
+                menubar.request_check()
 
         try:
             signal.signal(signal.SIGINT, shutdown)
@@ -311,16 +610,47 @@ class STTDaemon:
         finally:
             self.stop()
 
+    def _handle_signals(self) -> None:
+        """Act on requests recorded by the signal handlers installed in run()."""
+        if self._shutdown_requested:
+            self._shutdown_requested = False
+            self._logger.info("Shutting down...")
+            self._running = False
+            self._stop_event.set()
+            # If running with menubar, need to quit rumps event loop
+            if self._menubar_app is not None:
+                try:
+                    import rumps
+                    rumps.quit_application()
+                except Exception:
+                    pass
+            return
+
+        if self._toggle_requested:
+            self._toggle_requested = False
+            if self._recording:
+                self._logger.info("SIGUSR1: stopping recording")
+                self._on_recording_stop()
+            else:
+                self._logger.info("SIGUSR1: starting recording")
+                self._on_recording_start()
+
     def _run_headless(self):
         """Run the daemon without menu bar UI.
 
-        This is the original main loop - a simple sleep/check loop.
+        Sleeps until the next max-recording deadline (or indefinitely while
+        idle) and is woken early when recording starts/stops or on shutdown.
         Used on Linux, Windows, or when menu bar is disabled.
         """
         self._logger.info("Running in headless mode")
-        while self._running:
+        self._waker.open()
+        while True:
+            self._waker.clear()
+            self._handle_signals()
+            if self._stop_event.is_set():
+                break
             self._check_max_recording_time()
-            time.sleep(0.1)
+            self._waker.wait(self._next_wakeup())
 
     def _run_with_menubar(self):
         """Run the daemon with macOS menu bar UI.
@@ -364,11 +694,10 @@ class STTDaemon:
         """Stop the daemon."""
         self._running = False
         self._stop_event.set()
+        self._waker.wake()
 
-        try:
-            self._transcribe_queue.put_nowait(None)
-        except queue.Full:
-            pass
+        self._transcribe_queue.close()
+        self._waker.close()
 
         if self._transcribe_thread:
             self._transcribe_thread.join(timeout=1.0)
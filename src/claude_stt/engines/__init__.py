@@ -5,7 +5,15 @@ import numpy as np
 
 
 class STTEngine(Protocol):
-    """Protocol for STT engines."""
+    """Protocol for STT engines.
+
+    transcribe() runs on the daemon's worker thread, so engines should spend
+    the decode in native code that drops the GIL; otherwise the hotkey
+    listener stalls for the whole transcription. Set releases_gil to False
+    for engines that can't, and the daemon will warn at startup.
+    """
+
+    releases_gil: bool
 
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         """Transcribe audio to text.
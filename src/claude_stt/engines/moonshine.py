@@ -28,6 +28,9 @@ class MoonshineEngine:
         - moonshine/base: ~400MB, better accuracy
     """
 
+    # onnxruntime releases the GIL while running the session.
+    releases_gil = True
+
     def __init__(self, model_name: str = "moonshine/base"):
         """Initialize the Moonshine engine.
 
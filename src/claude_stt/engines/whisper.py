@@ -22,6 +22,9 @@ except ImportError:
 class WhisperEngine:
     """Whisper speech-to-text engine backed by faster-whisper."""
 
+    # CTranslate2 releases the GIL during encode/decode.
+    releases_gil = True
+
     def __init__(
         self,
         model_name: str = "medium",
@@ -1,22 +1,35 @@
 """Global hotkey detection using pynput."""
 
 import logging
+import os
 import platform
 import queue
 import threading
 from typing import Callable, Optional
 
-try:
-    from pynput import keyboard
-    _PYNPUT_AVAILABLE = True
-    _PYNPUT_IMPORT_ERROR: Exception | None = None
-except Exception as exc:
-    keyboard = None
-    _PYNPUT_AVAILABLE = False
-    _PYNPUT_IMPORT_ERROR = exc
-
 from .errors import HotkeyError
 
+# pynput is imported on first use: on macOS it pulls in Quartz, which costs
+# CLI commands like status/stop a noticeable startup delay for nothing.
+keyboard = None
+_PYNPUT_AVAILABLE: Optional[bool] = None  # None until _load_pynput() runs
+_PYNPUT_IMPORT_ERROR: Exception | None = None
+
+
+def _load_pynput() -> bool:
+    """Import pynput.keyboard once; returns whether it is available."""
+    global keyboard, _PYNPUT_AVAILABLE, _PYNPUT_IMPORT_ERROR
+    if _PYNPUT_AVAILABLE is None:
+        try:
+            from pynput import keyboard as pynput_keyboard
+        except Exception as exc:
+            _PYNPUT_AVAILABLE = False
+            _PYNPUT_IMPORT_ERROR = exc
+        else:
+            keyboard = pynput_keyboard
+            _PYNPUT_AVAILABLE = True
+    return _PYNPUT_AVAILABLE
+
 
 class HotkeyListener:
     """Listens for global hotkey events.
@@ -39,6 +52,7 @@ class HotkeyListener:
             on_stop: Callback when recording should stop.
             mode: "push-to-talk" or "toggle".
         """
+        pynput_available = _load_pynput()
         self.hotkey_str = hotkey
         self.on_start = on_start
         self.on_stop = on_stop
@@ -56,7 +70,7 @@ class HotkeyListener:
         self._worker_thread: Optional[threading.Thread] = None
         self._worker_stop = threading.Event()
 
-        if not _PYNPUT_AVAILABLE:
+        if not pynput_available:
             message = "pynput unavailable; hotkeys cannot be registered"
             if _PYNPUT_IMPORT_ERROR:
                 message = f"{message}: {_PYNPUT_IMPORT_ERROR}"
@@ -248,13 +262,41 @@ class HotkeyListener:
                     self._is_recording = False
                     self._enqueue_event("stop", self.on_stop)
 
+    def can_start(self) -> tuple[bool, Optional[str]]:
+        """Cheaply check whether start() can work, without starting a listener.
+
+        Covers the usual failure causes: no X display (or uinput access) on
+        Linux, and a process without Accessibility permission on macOS.
+        Anything it can't determine is reported as startable.
+
+        Returns:
+            (ok, reason) where reason explains a False result.
+        """
+        if not _load_pynput():
+            return False, "pynput unavailable; hotkeys cannot be registered"
+        system = platform.system()
+        if system == "Linux":
+            if not os.environ.get("DISPLAY") and not os.access("/dev/uinput", os.W_OK):
+                return False, "No X display for the hotkey listener (DISPLAY is not set)"
+        elif system == "Darwin":
+            try:
+                from ApplicationServices import AXIsProcessTrusted
+            except Exception:
+                return True, None
+            if not AXIsProcessTrusted():
+                return False, (
+                    "Accessibility permission missing; allow this terminal in "
+                    "System Settings > Privacy & Security > Accessibility"
+                )
+        return True, None
+
     def start(self) -> bool:
         """Start listening for hotkeys.
 
         Returns:
             True if listener started successfully.
         """
-        if not _PYNPUT_AVAILABLE:
+        if not _load_pynput():
             self._logger.error("pynput unavailable; cannot start hotkey listener")
             return False
         if self._listener is not None:
@@ -1,38 +1,57 @@
 """Keyboard output: direct injection or clipboard fallback."""
 
+import functools
 import logging
 import shutil
 import subprocess
 import time
-from typing import Optional
-
-try:
-    from pynput.keyboard import Controller, Key
-    _PYNPUT_AVAILABLE = True
-    _PYNPUT_IMPORT_ERROR: Exception | None = None
-except Exception as exc:
-    Controller = None
-    Key = None
-    _PYNPUT_AVAILABLE = False
-    _PYNPUT_IMPORT_ERROR = exc
+from typing import Callable, Optional
 
 from .config import Config, is_wayland
 from .sounds import play_sound
 from .window import WindowInfo, restore_focus
 
+# pynput is imported on first use (see _load_pynput).
+Controller = None
+Key = None
+_PYNPUT_AVAILABLE: Optional[bool] = None  # None until _load_pynput() runs
+_PYNPUT_IMPORT_ERROR: Exception | None = None
+
 # Global keyboard controller
 _keyboard: Optional[Controller] = None
+# Bound _keyboard.type, cached for per-word streaming output.
+_keyboard_type = None
 _injection_capable: Optional[bool] = None
 _injection_checked_at: Optional[float] = None
 _injection_cache_ttl = 300.0
+# Set once injection has worked; success isn't re-probed after that.
+_injection_sticky = False
 _logger = logging.getLogger(__name__)
 _pynput_warned = False
+_default_config_cache: Optional[Config] = None
+# Characters typed per pynput call before yielding to other threads.
+_TYPE_CHUNK_CHARS = 64
+
+
+def _load_pynput() -> bool:
+    """Import pynput's keyboard controller once; returns whether it is available."""
+    global Controller, Key, _PYNPUT_AVAILABLE, _PYNPUT_IMPORT_ERROR
+    if _PYNPUT_AVAILABLE is None:
+        try:
+            from pynput.keyboard import Controller as PynputController, Key as PynputKey
+        except Exception as exc:
+            _PYNPUT_AVAILABLE = False
+            _PYNPUT_IMPORT_ERROR = exc
+        else:
+            Controller, Key = PynputController, PynputKey
+            _PYNPUT_AVAILABLE = True
+    return _PYNPUT_AVAILABLE
 
 
 def get_keyboard() -> Controller:
     """Get the global keyboard controller."""
     global _keyboard
-    if not _PYNPUT_AVAILABLE:
+    if not _load_pynput():
         raise RuntimeError("pynput unavailable; keyboard injection disabled")
     if _keyboard is None:
         _keyboard = Controller()
@@ -50,9 +69,27 @@ def _warn_pynput_missing() -> None:
     _pynput_warned = True
 
 
+@functools.lru_cache(maxsize=1)
+def _wtype_path() -> Optional[str]:
+    """Resolve wtype on PATH once; it won't appear or vanish mid-session."""
+    return shutil.which("wtype")
+
+
+def _type_in_chunks(kb: Controller, text: str) -> None:
+    """Type text in short runs, yielding the GIL between them.
+
+    pynput types one character at a time in Python, so a long transcription
+    would otherwise keep the hotkey listener waiting until it finishes.
+    """
+    for start in range(0, len(text), _TYPE_CHUNK_CHARS):
+        if start:
+            time.sleep(0)
+        kb.type(text[start : start + _TYPE_CHUNK_CHARS])
+
+
 def _has_wtype() -> bool:
     """Check if wtype is available for Wayland text input."""
-    return shutil.which("wtype") is not None
+    return _wtype_path() is not None
 
 
 def _output_via_wtype(text: str, config: Config) -> bool:
@@ -66,8 +103,10 @@ def _output_via_wtype(text: str, config: Config) -> bool:
         True if successful, False otherwise.
     """
     try:
+        # "-" reads the text from stdin, so long transcriptions stay out of argv.
         result = subprocess.run(
-            ["wtype", "--", text],
+            [_wtype_path() or "wtype", "-"],
+            input=text.encode("utf-8"),
             capture_output=True,
             timeout=10,
         )
@@ -95,6 +134,8 @@ def test_injection() -> bool:
         True if injection appears to work, False otherwise.
     """
     global _injection_capable, _injection_checked_at
+    if _injection_sticky:
+        return True
     now = time.monotonic()
 
     # Return cached result if still valid
@@ -106,16 +147,18 @@ def test_injection() -> bool:
         return _injection_capable
 
     def cache_result(capable: bool) -> bool:
-        global _injection_capable, _injection_checked_at
+        global _injection_capable, _injection_checked_at, _injection_sticky
         _injection_capable = capable
         _injection_checked_at = now
+        # Failures keep the TTL so a later check can recover.
+        _injection_sticky = capable
         return capable
 
     # On Wayland, check for wtype
     if is_wayland():
         return cache_result(_has_wtype())
 
-    if not _PYNPUT_AVAILABLE:
+    if not _load_pynput():
         _warn_pynput_missing()
         return cache_result(False)
 
@@ -144,7 +187,7 @@ def output_text(
         True if text was output successfully, False otherwise.
     """
     if config is None:
-        config = Config.load().validate()
+        config = _default_config()
 
     # Determine output mode
     mode = config.output_mode
@@ -158,6 +201,18 @@ def output_text(
     return _output_via_injection(text, window_info, config)
 
 
+def _default_config() -> Config:
+    """Config for callers that don't pass one, loaded once per process.
+
+    Like the daemon, which reads its config at startup, this doesn't pick up
+    later edits to config.toml.
+    """
+    global _default_config_cache
+    if _default_config_cache is None:
+        _default_config_cache = Config.load()
+    return _default_config_cache
+
+
 def _output_via_injection(
     text: str,
     window_info: Optional[WindowInfo],
@@ -174,37 +229,58 @@ def _output_via_injection(
         True if successful, False otherwise.
     """
     try:
-        # On Wayland, use wtype
-        if is_wayland():
-            if _has_wtype():
-                return _output_via_wtype(text, config)
-            _logger.warning("wtype not available; falling back to clipboard")
-            return _output_via_clipboard(text, config)
-
-        if not _PYNPUT_AVAILABLE:
-            _warn_pynput_missing()
-            return _output_via_clipboard(text, config)
-        # Restore focus to original window if provided
-        if window_info is not None:
-            if not restore_focus(window_info):
-                # Can't restore focus (window closed?), fall back to clipboard
-                _logger.warning("Focus restore failed; falling back to clipboard")
-                return _output_via_clipboard(text, config)
-
-        # Type the text
-        kb = get_keyboard()
-        kb.type(text)
-
-        if config.sound_effects:
-            play_sound("complete")
-
-        return True
+        return _injection_backend()(text, window_info, config)
     except Exception:
         # Fall back to clipboard on any error
         _logger.warning("Injection failed; falling back to clipboard", exc_info=True)
         return _output_via_clipboard(text, config)
 
 
+@functools.lru_cache(maxsize=1)
+def _injection_backend() -> Callable[[str, Optional[WindowInfo], Config], bool]:
+    """Pick the injection implementation once; the session type and tools are fixed."""
+    if is_wayland():
+        return _inject_wtype if _has_wtype() else _inject_wayland_clipboard
+    if not _load_pynput():
+        return _inject_pynput_missing
+    return _inject_pynput
+
+
+def _inject_wtype(text: str, window_info: Optional[WindowInfo], config: Config) -> bool:
+    return _output_via_wtype(text, config)
+
+
+def _inject_wayland_clipboard(
+    text: str, window_info: Optional[WindowInfo], config: Config
+) -> bool:
+    _logger.warning("wtype not available; falling back to clipboard")
+    return _output_via_clipboard(text, config)
+
+
+def _inject_pynput_missing(
+    text: str, window_info: Optional[WindowInfo], config: Config
+) -> bool:
+    _warn_pynput_missing()
+    return _output_via_clipboard(text, config)
+
+
+def _inject_pynput(text: str, window_info: Optional[WindowInfo], config: Config) -> bool:
+    # Restore focus to original window if provided
+    if window_info is not None:
+        if not restore_focus(window_info):
+            # Can't restore focus (window closed?), fall back to clipboard
+            _logger.warning("Focus restore failed; falling back to clipboard")
+            return _output_via_clipboard(text, config)
+
+    # Type the text
+    _type_in_chunks(get_keyboard(), text)
+
+    if config.sound_effects:
+        play_sound("complete")
+
+    return True
+
+
 def _output_via_clipboard(text: str, config: Config) -> bool:
     """Output text by copying to clipboard.
 
@@ -249,9 +325,12 @@ def type_text_streaming(text: str) -> bool:
     Returns:
         True if successful, False otherwise.
     """
+    global _keyboard_type
     try:
-        kb = get_keyboard()
-        kb.type(text)
+        type_text = _keyboard_type
+        if type_text is None:
+            type_text = _keyboard_type = get_keyboard().type
+        type_text(text)
         return True
     except Exception:
         return False
@@ -7,15 +7,22 @@ It provides visual feedback for recording state in the menu bar.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING, Callable, Optional
 
 import rumps
+from Foundation import NSThread
+from PyObjCTools import AppHelper
 
 if TYPE_CHECKING:
     from .daemon_service import STTDaemon
 
 logger = logging.getLogger(__name__)
 
+# How often the timer looks for a new recording while idle. Once one is seen,
+# the next check is scheduled for the daemon's actual deadline instead.
+_IDLE_CHECK_INTERVAL = 1.0
+
 
 class STTMenuBar(rumps.App):
     """Menu bar app that shows recording state.
@@ -31,6 +38,11 @@ class STTMenuBar(rumps.App):
     ICON_RECORDING = "\U0001F534"  # 🔴 red circle
     ICON_PROCESSING = "\u25CB"  # ○ empty circle (processing)
 
+    # (title, status) for each state, built once rather than per callback.
+    _STATE_IDLE = (ICON_IDLE, "Status: Ready")
+    _STATE_RECORDING = (ICON_RECORDING, "Status: Recording...")
+    _STATE_PROCESSING = (ICON_PROCESSING, "Status: Processing...")
+
     def __init__(
         self,
         daemon: "STTDaemon",
@@ -46,9 +58,14 @@ class STTMenuBar(rumps.App):
         self.daemon = daemon
         self._on_quit = on_quit
         self._recording = False
+        # Latest (title, status) waiting for the main thread; see _post.
+        self._pending_ui: Optional[tuple[str, str]] = None
+        self._pending_lock = threading.Lock()
+        # Last (title, status) pushed to Cocoa; see _apply_ui.
+        self._applied_ui: tuple[str, str] = self._STATE_IDLE
 
         # Build menu
-        self._status_item = rumps.MenuItem("Status: Ready")
+        self._status_item = rumps.MenuItem(self._STATE_IDLE[1])
         self._hotkey_item = rumps.MenuItem(f"Hotkey: {daemon.config.hotkey}")
         self._stop_daemon_item = rumps.MenuItem("Stop Daemon", callback=self._stop_daemon)
         self._quit_item = rumps.MenuItem("Quit", callback=self._quit)
@@ -61,60 +78,116 @@ class STTMenuBar(rumps.App):
             self._quit_item,
         ]
 
-        # Set up timer for max recording time checks
-        # This replaces the main loop's time.sleep(0.1)
-        self._timer = rumps.Timer(self._check_max_recording_time, 0.1)
+        # Timer for max recording time checks (replaces the headless loop's wait)
+        self._timer: Optional[rumps.Timer] = None
 
     def start_timer(self) -> None:
-        """Start the periodic timer for recording time checks."""
+        """Start the timer for recording time checks."""
+        self._schedule_check(_IDLE_CHECK_INTERVAL)
+
+    def _schedule_check(self, interval: float) -> None:
+        """Run the next max-recording check after interval seconds.
+
+        Must be called on the main thread, whose run loop fires the timer.
+        """
+        self._timer = rumps.Timer(self._check_max_recording_time, interval)
         self._timer.start()
 
     def on_recording_start(self) -> None:
         """Update UI when recording starts.
 
         Called from hotkey callback thread - must be non-blocking.
-        rumps handles the Cocoa UI update asynchronously.
+        The Cocoa update itself is posted to the main thread.
         """
-        try:
-            self._recording = True
-            self.title = self.ICON_RECORDING
-            self._status_item.title = "Status: Recording..."
-        except Exception:
-            # Don't let UI errors affect recording
-            logger.exception("Failed to update menu bar on recording start")
+        self._recording = True
+        self._post(*self._STATE_RECORDING)
 
     def on_recording_stop(self) -> None:
         """Update UI when recording stops.
 
         Called from hotkey callback thread - must be non-blocking.
         """
-        try:
-            self._recording = False
-            self.title = self.ICON_PROCESSING
-            self._status_item.title = "Status: Processing..."
-        except Exception:
-            logger.exception("Failed to update menu bar on recording stop")
+        self._recording = False
+        self._post(*self._STATE_PROCESSING)
 
     def on_transcription_complete(self) -> None:
         """Update UI when transcription is complete.
 
         Called from transcription worker thread.
         """
+        self._post(*self._STATE_IDLE)
+
+    def _post(self, title: str, status: str) -> None:
+        """Apply a UI update on the main thread.
+
+        Cocoa views must only be touched from the main thread. Calls from
+        other threads store the latest state and schedule at most one
+        AppHelper.callAfter, so bursts of updates collapse into one.
+        """
+        if NSThread.isMainThread():
+            with self._pending_lock:
+                self._pending_ui = None
+            self._apply_ui(title, status)
+            return
+        with self._pending_lock:
+            scheduled = self._pending_ui is not None
+            self._pending_ui = (title, status)
+        if not scheduled:
+            try:
+                AppHelper.callAfter(self._apply_pending_ui)
+            except Exception:
+                logger.exception("Failed to schedule menu bar update")
+
+    def _apply_pending_ui(self) -> None:
+        with self._pending_lock:
+            pending, self._pending_ui = self._pending_ui, None
+        if pending is not None:
+            self._apply_ui(*pending)
+
+    def _apply_ui(self, title: str, status: str) -> None:
+        # Skip the round trip into AppKit when nothing visible changes.
+        if (title, status) == self._applied_ui:
+            return
         try:
-            self.title = self.ICON_IDLE
-            self._status_item.title = "Status: Ready"
+            self.title = title
+            self._status_item.title = status
         except Exception:
-            logger.exception("Failed to update menu bar on transcription complete")
+            # Don't let UI errors affect recording
+            logger.exception("Failed to update menu bar")
+            return
+        self._applied_ui = (title, status)
 
-    def _check_max_recording_time(self, _sender: rumps.Timer) -> None:
-        """Periodic check for max recording time.
+    def _check_max_recording_time(self, sender: Optional[rumps.Timer]) -> None:
+        """Check for max recording time, then schedule the next check.
 
-        This delegates to the daemon's check method.
+        This delegates to the daemon's check method, after acting on any
+        signals the daemon has recorded. Each timer fires once; the next one
+        is due at the daemon's next deadline while recording, or after the
+        idle interval otherwise.
         """
+        if sender is not None:
+            sender.stop()
+        if self._timer is not None and self._timer is not sender:
+            self._timer.stop()
+        interval = None
         try:
+            self.daemon._handle_signals()
             self.daemon._check_max_recording_time()
+            interval = self.daemon._next_wakeup()
         except Exception:
             logger.exception("Error in max recording time check")
+        self._schedule_check(interval if interval is not None else _IDLE_CHECK_INTERVAL)
+
+    def request_check(self) -> None:
+        """Run the max-recording check on the main thread as soon as possible.
+
+        Safe to call from any thread; the daemon calls it from the audio
+        thread once the recording buffer is full, and from its signal handlers.
+        """
+        try:
+            AppHelper.callAfter(self._check_max_recording_time, None)
+        except Exception:
+            logger.exception("Failed to schedule max recording check")
 
     def _stop_daemon(self, _sender: rumps.MenuItem) -> None:
         """Handle 'Stop Daemon' menu click."""
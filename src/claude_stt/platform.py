@@ -1,35 +1,54 @@
 """Platform detection utilities for claude-stt."""
 
+import functools
 import sys
 
+# sys.platform can't change at runtime, so each check is worked out once.
+# Tests that patch sys.platform call reset_cache() around the patch.
 
+
+@functools.lru_cache(maxsize=1)
 def is_macos() -> bool:
     """Check if running on macOS."""
     return sys.platform == "darwin"
 
 
+@functools.lru_cache(maxsize=1)
 def is_linux() -> bool:
     """Check if running on Linux."""
     return sys.platform == "linux"
 
 
+@functools.lru_cache(maxsize=1)
 def is_windows() -> bool:
     """Check if running on Windows."""
     return sys.platform == "win32"
 
 
+@functools.lru_cache(maxsize=1)
 def menubar_available() -> bool:
     """Check if menu bar support is available (macOS + rumps installed).
 
     Returns True only if:
     - Running on macOS
     - rumps is installed and importable
+
+    The import is attempted on first call (rumps pulls in AppKit, so it is
+    not done at module import) and the answer is remembered.
     """
-    if not is_macos():
-        return False
+    return is_macos() and _rumps_importable()
+
+
+def _rumps_importable() -> bool:
     try:
         import rumps  # noqa: F401
 
         return True
     except ImportError:
         return False
+
+
+def reset_cache() -> None:
+    """Forget cached platform checks (e.g. after patching sys.platform in tests)."""
+    for check in (is_macos, is_linux, is_windows, menubar_available):
+        check.cache_clear()
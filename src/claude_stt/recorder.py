@@ -1,12 +1,12 @@
 """Audio recording using sounddevice."""
 
+import functools
 import logging
 import math
-import queue
-import threading
+import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Generator, Optional
+from typing import Callable, Deque, Generator, Optional
 
 import numpy as np
 
@@ -18,6 +18,42 @@ except Exception as exc:
     _SOUNDDEVICE_IMPORT_ERROR = exc
 
 
+# get_volume_level maps [_VOLUME_MIN_DB, _VOLUME_MAX_DB] onto [0, 1] (typical
+# voice levels; adjust based on testing).
+_VOLUME_MIN_DB = -60.0
+_VOLUME_MAX_DB = -10.0
+_VOLUME_SCALE = 1.0 / (_VOLUME_MAX_DB - _VOLUME_MIN_DB)
+_VOLUME_BIAS = -_VOLUME_MIN_DB * _VOLUME_SCALE
+
+
+def _pcm_scale(dtype: np.dtype) -> Optional[np.float32]:
+    """Factor mapping signed integer PCM onto [-1, 1), or None for floats."""
+    if dtype.kind != "i":
+        return None
+    return np.float32(1.0 / (np.iinfo(dtype).max + 1))
+
+
+def _as_float32(audio: np.ndarray) -> np.ndarray:
+    """Return audio as float32 samples in [-1, 1)."""
+    scale = _pcm_scale(audio.dtype)
+    return audio if scale is None else audio * scale
+
+
+def _store_float32(dst: np.ndarray, src: np.ndarray) -> None:
+    """Copy src into a float32 buffer, scaling integer PCM on the way."""
+    scale = _pcm_scale(src.dtype)
+    if scale is None:
+        dst[...] = src
+    else:
+        np.multiply(src, scale, out=dst)
+
+
+@functools.lru_cache(maxsize=1)
+def _query_devices() -> tuple:
+    """Enumerate PortAudio devices once; start() clears it to pick up changes."""
+    return tuple(sd.query_devices())
+
+
 @dataclass
 class RecorderConfig:
     """Configuration for audio recording."""
@@ -25,6 +61,8 @@ class RecorderConfig:
     sample_rate: int = 16000
     channels: int = 1
     blocksize: int = 1024  # ~64ms at 16kHz
+    # float32 keeps stop() zero-copy with the daemon's float32 buffers; int16
+    # capture also works and is scaled to float32 on the way out.
     dtype: str = "float32"
     queue_maxsize: int = 32
     max_recording_seconds: Optional[int] = None
@@ -54,11 +92,31 @@ class AudioRecorder:
         """
         self.config = config or RecorderConfig()
         self._recording = False
-        self._audio_queue: queue.Queue[np.ndarray] = queue.Queue()
+        # Live chunks for get_chunk(): (ring start frame, frames) indices into
+        # _ring for bounded recordings, the chunk arrays themselves otherwise.
+        # deque.append/popleft are atomic, so this is a lock-free SPSC queue;
+        # when full, the oldest entry is dropped.
+        self._audio_queue: Deque = deque(maxlen=self.config.queue_maxsize)
         self._stream: Optional["sd.InputStream"] = None
         self._recorded_chunks: Deque[np.ndarray] = deque()
         self._max_chunks = self._compute_max_chunks()
-        self._lock = threading.Lock()
+        # Bounded recordings go into a preallocated ring (kept across recordings)
+        # so the realtime callback never allocates. _written counts frames ever
+        # written; the ring holds the last len(_ring) of them.
+        self._ring: Optional[np.ndarray] = None
+        # True when _ring is a caller-supplied buffer (see start()); those are
+        # handed back by stop() rather than kept.
+        self._ring_borrowed = False
+        self._written = 0
+        # Called once per bounded recording, on the audio thread, when the
+        # ring fills (i.e. the max recording length has been captured). It
+        # must not block or stop the stream itself.
+        self.on_full: Optional[Callable[[], None]] = None
+        self._full_notified = False
+        self._poll_interval = self.config.blocksize / self.config.sample_rate / 4
+        # Set when device enumeration fails so availability checks stop
+        # re-probing PortAudio; start() clears it.
+        self._unavailable = False
         self._logger = logging.getLogger(__name__)
 
     def _compute_max_chunks(self) -> Optional[int]:
@@ -69,16 +127,23 @@ class AudioRecorder:
         chunks = max_seconds * self.config.sample_rate / self.config.blocksize
         return max(1, int(math.ceil(chunks)))
 
-    def is_available(self) -> bool:
-        """Check if audio recording is available."""
-        if sd is None:
-            return False
-
+    def _devices(self) -> Optional[tuple]:
+        """Enumerated devices, or None if the audio backend is unusable."""
+        if sd is None or self._unavailable:
+            return None
         try:
-            devices = sd.query_devices()
-            return any(d.get("max_input_channels", 0) > 0 for d in devices)
+            return _query_devices()
         except Exception:
+            self._logger.debug("Audio device enumeration failed", exc_info=True)
+            self._unavailable = True
+            return None
+
+    def is_available(self) -> bool:
+        """Check if audio recording is available."""
+        devices = self._devices()
+        if devices is None:
             return False
+        return any(d.get("max_input_channels", 0) > 0 for d in devices)
 
     def get_devices(self) -> list[dict]:
         """Get available input devices.
@@ -86,11 +151,10 @@ class AudioRecorder:
         Returns:
             List of device info dictionaries.
         """
-        if sd is None:
+        devices = self._devices()
+        if devices is None:
             return []
-
         try:
-            devices = sd.query_devices()
             return [
                 {"name": d["name"], "index": i, "channels": d["max_input_channels"]}
                 for i, d in enumerate(devices)
@@ -99,9 +163,14 @@ class AudioRecorder:
         except Exception:
             return []
 
-    def start(self) -> bool:
+    def start(self, buffer: Optional[np.ndarray] = None) -> bool:
         """Start recording audio.
 
+        Args:
+            buffer: Optional 1-D buffer of ``max_samples`` frames to record mono
+                audio into. If the recording doesn't wrap, stop() returns a
+                view of it without copying. The recorder releases it on stop().
+
         Returns:
             True if recording started successfully.
         """
@@ -111,29 +180,18 @@ class AudioRecorder:
         if self._recording:
             return True
 
+        # Devices may have been plugged or unplugged since the last lookup.
+        _query_devices.cache_clear()
+        self._unavailable = False
         try:
-            self._audio_queue = queue.Queue(maxsize=self.config.queue_maxsize)
-            self._recorded_chunks = (
-                deque(maxlen=self._max_chunks) if self._max_chunks else deque()
-            )
-
-            def callback(indata, frames, time_info, status):
-                if status:
-                    self._logger.debug("Audio callback status: %s", status)
-                try:
-                    self._audio_queue.put_nowait(indata.copy())
-                except queue.Full:
-                    self._logger.debug("Audio queue full; dropping chunk")
-                with self._lock:
-                    self._recorded_chunks.append(indata.copy())
-
+            self._reset_buffers(buffer)
             self._stream = sd.InputStream(
                 samplerate=self.config.sample_rate,
                 channels=self.config.channels,
                 dtype=self.config.dtype,
                 blocksize=self.config.blocksize,
                 device=self.config.device,
-                callback=callback,
+                callback=self._on_audio,
             )
             self._stream.start()
             self._recording = True
@@ -143,9 +201,84 @@ class AudioRecorder:
             self._logger.exception("Failed to start audio recording")
             return False
 
-    def stop(self) -> Optional[np.ndarray]:
+    def _reset_buffers(self, buffer: Optional[np.ndarray] = None) -> None:
+        self._audio_queue = deque(maxlen=self.config.queue_maxsize)
+        self._written = 0
+        self._full_notified = False
+        if not self._max_chunks:
+            self._recorded_chunks = deque()
+            return
+        frames = self._max_chunks * self.config.blocksize
+        if (
+            buffer is not None
+            and self.config.channels == 1
+            and buffer.shape == (frames,)
+            and buffer.dtype == np.dtype(self.config.dtype)
+        ):
+            self._ring = buffer.reshape(frames, 1)
+            self._ring_borrowed = True
+        elif self._ring_borrowed or self._ring is None or len(self._ring) != frames:
+            self._ring = np.empty((frames, self.config.channels), dtype=self.config.dtype)
+            self._ring_borrowed = False
+
+    def _on_audio(self, indata, frames, time_info, status) -> None:
+        """sounddevice callback; runs on the realtime audio thread."""
+        if status:
+            self._logger.debug("Audio callback status: %s", status)
+        ring = self._ring
+        if ring is None:
+            # deque.append is atomic and stop() only reads after the stream has
+            # stopped, so no lock is needed on the realtime thread.
+            chunk = indata.copy()
+            self._recorded_chunks.append(chunk)
+            item = chunk
+        else:
+            size = len(ring)
+            written = self._written
+            if frames > size:
+                # Only the newest `size` frames can be kept.
+                indata = indata[frames - size :]
+                written += frames - size
+                frames = size
+            pos = written % size
+            first = min(frames, size - pos)
+            np.copyto(ring[pos : pos + first], indata[:first])
+            if frames > first:
+                np.copyto(ring[: frames - first], indata[first:])
+            # Publish after the data is in place; a plain int store is atomic.
+            self._written = written + frames
+            item = (written, frames)
+        self._audio_queue.append(item)
+        if ring is not None and self._written >= len(ring) and not self._full_notified:
+            self._full_notified = True
+            on_full = self.on_full
+            if on_full is not None:
+                on_full()
+
+    def _ring_frames(self, start: int, frames: int) -> np.ndarray:
+        """Copy frames [start, start + frames) out of the ring, oldest first."""
+        ring = self._ring
+        size = len(ring)
+        pos = start % size
+        if pos + frames <= size:
+            return ring[pos : pos + frames].copy()
+        return np.concatenate((ring[pos:], ring[: pos + frames - size]))
+
+    @property
+    def max_samples(self) -> Optional[int]:
+        """Upper bound on the frames stop() can return, or None if unbounded."""
+        if self._max_chunks is None:
+            return None
+        return self._max_chunks * self.config.blocksize
+
+    def stop(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """Stop recording and return all recorded audio.
 
+        Args:
+            out: Optional preallocated 1-D buffer. For mono recordings that fit,
+                samples are copied into it and a view of ``out`` is returned
+                instead of a newly allocated array.
+
         Returns:
             Numpy array of all recorded audio, or None if no audio.
         """
@@ -161,14 +294,53 @@ class AudioRecorder:
         self._stream = None
         self._recording = False
 
-        with self._lock:
-            if not self._recorded_chunks:
-                return None
-
-            # Concatenate all chunks
-            audio = np.concatenate(list(self._recorded_chunks))
-            self._recorded_chunks = deque()
-            return np.squeeze(audio)
+        if self._ring is not None:
+            audio = self._stop_ring(out)
+            if self._ring_borrowed:
+                # Never keep the caller's buffer past this recording.
+                self._ring = None
+                self._ring_borrowed = False
+            return audio
+
+        # The stream is stopped, so the callback no longer appends.
+        chunks = self._recorded_chunks
+        if not chunks:
+            return None
+        self._recorded_chunks = deque()
+
+        if out is not None and self.config.channels == 1:
+            total = sum(len(chunk) for chunk in chunks)
+            if total <= len(out):
+                pos = 0
+                for chunk in chunks:
+                    frames = len(chunk)
+                    _store_float32(out[pos : pos + frames], chunk.reshape(-1))
+                    pos += frames
+                return out[:pos]
+
+        # Concatenate all chunks
+        audio = np.concatenate(list(chunks))
+        return _as_float32(np.squeeze(audio))
+
+    def _stop_ring(self, out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        # The stream is stopped, so the callback no longer touches the ring.
+        written = self._written
+        if not written:
+            return None
+        size = len(self._ring)
+        frames = min(written, size)
+        start = written - frames
+        if out is None and self._ring_borrowed and written <= size:
+            # Unwrapped recording into the caller's buffer: hand back a view.
+            return self._ring[:frames, 0]
+        if out is not None and self.config.channels == 1 and frames <= len(out):
+            pos = start % size
+            first = min(frames, size - pos)
+            _store_float32(out[:first], self._ring[pos : pos + first, 0])
+            if frames > first:
+                _store_float32(out[first:frames], self._ring[: frames - first, 0])
+            return out[:frames]
+        return _as_float32(np.squeeze(self._ring_frames(start, frames)))
 
     def get_chunk(self, timeout: float = 0.1) -> Optional[np.ndarray]:
         """Get the next audio chunk from the recording stream.
@@ -179,11 +351,25 @@ class AudioRecorder:
         Returns:
             Audio chunk as numpy array, or None if timeout.
         """
-        try:
-            chunk = self._audio_queue.get(timeout=timeout)
-            return np.squeeze(chunk)
-        except queue.Empty:
-            return None
+        live = self._audio_queue
+        deadline = None
+        while not live:
+            # The producer is the realtime callback, which mustn't signal a
+            # Condition; poll at a fraction of the block duration instead.
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + timeout
+            remaining = deadline - now
+            if remaining <= 0:
+                return None
+            time.sleep(min(remaining, self._poll_interval))
+        item = live.popleft()
+        if isinstance(item, tuple):
+            if self._ring is None:
+                return None
+            # Copy out of the ring here, off the realtime thread.
+            item = self._ring_frames(*item)
+        return _as_float32(np.squeeze(item))
 
     def iter_chunks(self) -> Generator[np.ndarray, None, None]:
         """Iterate over audio chunks while recording.
@@ -213,15 +399,14 @@ class AudioRecorder:
         if chunk.size == 0:
             return 0.0
 
-        # RMS volume
-        rms = np.sqrt(np.mean(chunk**2))
+        # RMS volume; a dot product reduces in one pass with no chunk**2 temporary.
+        # 20*log10(sqrt(ms)) == 10*log10(ms), so the square root is skipped.
+        samples = _as_float32(chunk.reshape(-1))
+        mean_square = float(np.dot(samples, samples)) / samples.size
 
         # Normalize to 0-1 range (assuming typical voice levels)
-        # Adjust these thresholds based on testing
-        min_db = -60
-        max_db = -10
-        db = 20 * np.log10(max(rms, 1e-10))
-        normalized = (db - min_db) / (max_db - min_db)
+        db = 10.0 * math.log10(mean_square) if mean_square > 1e-20 else -200.0
+        normalized = db * _VOLUME_SCALE + _VOLUME_BIAS
         return max(0.0, min(1.0, normalized))
 
 
@@ -3,28 +3,57 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
+import json
 import logging
 import os
 import shutil
-import subprocess
+import stat
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Sequence
+from platform import platform as _os_build
+from typing import Any, Callable, Sequence
 
+from . import __version__
 from .config import Config, get_platform, is_wayland, is_wsl
-from .daemon import is_daemon_running
-from .engine_factory import build_engine
 from .errors import EngineError, HotkeyError
-from .hotkey import HotkeyListener
-from .recorder import AudioRecorder, get_sounddevice_import_error
+
+# The daemon, engine, hotkey and recorder modules pull in numpy, pynput and
+# sounddevice, so they are imported by the checks that need them rather than
+# here; `setup --help` and skipped checks don't pay for them.
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_ROOT = Path(os.path.dirname(os.path.dirname(_PACKAGE_DIR)))
+
+# PATH lookups don't change during a setup run, and _dependency_hint runs on
+# several error paths.
+_which = functools.lru_cache(maxsize=32)(shutil.which)
+
+# A passing hotkey test is remembered in the config dir and trusted for a day
+# for the same hotkey and OS build; see _check_hotkey.
+_HOTKEY_OK_FILE = "hotkey_ok.json"
+_HOTKEY_OK_TTL = 24 * 60 * 60
+
+# Likewise a successful model load, for the same engine, model and package
+# version; see _ensure_engine_ready.
+_ENGINE_OK_FILE = "engine_ok.json"
+
+# Checks running on worker threads buffer their messages here so they can be
+# printed in the usual order once collected.
+_output = threading.local()
 
 
 def _get_plugin_root() -> Path:
     env_root = os.environ.get("CLAUDE_PLUGIN_ROOT")
     if env_root:
-        return Path(env_root).expanduser()
-    return Path(__file__).resolve().parents[2]
+        path = Path(env_root)
+        return path.expanduser() if env_root.startswith("~") else path
+    return _DEFAULT_ROOT
 
 
 def _ensure_plugin_root_env(plugin_root: Path) -> None:
@@ -32,13 +61,15 @@ def _ensure_plugin_root_env(plugin_root: Path) -> None:
 
 
 def _validate_plugin_root(plugin_root: Path) -> bool:
-    if not plugin_root.exists():
+    try:
+        st = os.stat(plugin_root)
+    except OSError:
         _print_error(f"Plugin root not found: {plugin_root}")
         return False
-    if not plugin_root.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         _print_error(f"Plugin root is not a directory: {plugin_root}")
         return False
-    if not (plugin_root / "src" / "claude_stt").exists():
+    if not os.path.exists(os.path.join(plugin_root, "src", "claude_stt")):
         _print_warn("Plugin root missing src/claude_stt; continuing anyway.")
     return True
 
@@ -50,16 +81,61 @@ def _configure_logging(level: str) -> None:
     )
 
 
+def _emit(message: str, error: bool = False) -> None:
+    buffer = getattr(_output, "buffer", None)
+    if buffer is not None:
+        buffer.append((message, error))
+    else:
+        print(message, file=sys.stderr if error else sys.stdout)
+
+
 def _print_info(message: str) -> None:
-    print(message)
+    _emit(message)
 
 
 def _print_warn(message: str) -> None:
-    print(f"Warning: {message}")
+    _emit(f"Warning: {message}")
 
 
 def _print_error(message: str) -> None:
-    print(f"Error: {message}", file=sys.stderr)
+    _emit(f"Error: {message}", error=True)
+
+
+def _captured(func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any, list]:
+    """Run func with its setup messages buffered instead of printed."""
+    _output.buffer = []
+    try:
+        return func(*args, **kwargs), _output.buffer
+    finally:
+        del _output.buffer
+
+
+def _flush(captured: tuple[Any, list]) -> Any:
+    """Print messages buffered by _captured and return the check's result."""
+    result, messages = captured
+    buffer = getattr(_output, "buffer", None)
+    if buffer is not None:
+        buffer.extend(messages)
+        return result
+    # One write per run of same-stream messages rather than one per line.
+    for error, run in itertools.groupby(messages, key=lambda item: item[1]):
+        stream = sys.stderr if error else sys.stdout
+        stream.write("".join(f"{message}\n" for message, _ in run))
+    return result
+
+
+class _Deferred:
+    """Future stand-in that runs its call when result() is first asked for.
+
+    Used by --serial-probes so the checks run one at a time, in the order
+    their results are consumed.
+    """
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        self._call = functools.partial(func, *args, **kwargs)
+
+    def result(self) -> Any:
+        return self._call()
 
 
 def _get_python_install_hint() -> str:
@@ -84,7 +160,9 @@ def _check_python_version() -> bool:
 
 
 def _ensure_config() -> Config | None:
-    config = Config.load().validate()
+    # load() returns an already-validated config (from the on-disk cache when
+    # config.toml is unchanged), so don't validate it a second time.
+    config = Config.load()
     config_path = Config.get_config_path()
     if not config_path.exists():
         if not config.save():
@@ -99,7 +177,48 @@ def _ensure_config() -> Config | None:
     return config
 
 
-def _check_hotkey(config: Config) -> bool:
+def _read_setup_marker(filename: str) -> dict | None:
+    """Read a record left in the config dir by an earlier successful check."""
+    try:
+        path = Config.get_config_dir() / filename
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_setup_marker(filename: str, record: dict) -> None:
+    try:
+        path = Config.get_config_dir() / filename
+        path.write_text(json.dumps(record), encoding="utf-8")
+    except OSError:
+        logging.getLogger(__name__).debug("Could not write %s", filename, exc_info=True)
+
+
+def _hotkey_recently_verified(config: Config) -> bool:
+    data = _read_setup_marker(_HOTKEY_OK_FILE)
+    if data is None:
+        return False
+    checked_at = data.get("checked_at")
+    return (
+        data.get("hotkey") == config.hotkey
+        and data.get("os") == _os_build()
+        and isinstance(checked_at, (int, float))
+        and 0 <= time.time() - checked_at < _HOTKEY_OK_TTL
+    )
+
+
+def _remember_hotkey_ok(config: Config) -> None:
+    record = {"hotkey": config.hotkey, "os": _os_build(), "checked_at": time.time()}
+    _write_setup_marker(_HOTKEY_OK_FILE, record)
+
+
+def _check_hotkey(config: Config, force: bool = False, strict: bool = False) -> bool:
+    if not force and _hotkey_recently_verified(config):
+        _print_info("Hotkey verified recently; skipping listener test.")
+        return True
+    from .hotkey import HotkeyListener
+
     try:
         listener = HotkeyListener(hotkey=config.hotkey, mode=config.mode)
     except HotkeyError as exc:
@@ -114,6 +233,17 @@ def _check_hotkey(config: Config) -> bool:
     except Exception:
         logging.getLogger(__name__).exception("Hotkey initialization failed")
         return False
+
+    ok, reason = listener.can_start()
+    if not ok:
+        _print_error(reason or "Hotkey listener cannot start.")
+        return False
+    if not strict:
+        # Starting a real listener costs a thread plus an X11/Quartz hook; the
+        # capability check above covers the usual failures.
+        _remember_hotkey_ok(config)
+        return True
+
     try:
         if not listener.start():
             _print_error(
@@ -121,12 +251,15 @@ def _check_hotkey(config: Config) -> bool:
                 "re-run with --skip-hotkey-test."
             )
             return False
+        _remember_hotkey_ok(config)
         return True
     finally:
         listener.stop()
 
 
 def _check_audio() -> bool:
+    from .recorder import AudioRecorder, get_sounddevice_import_error
+
     recorder = AudioRecorder()
     if recorder.is_available():
         devices = recorder.get_devices()
@@ -163,6 +296,12 @@ def _check_clipboard() -> bool:
         )
         return False
 
+    detected = _clipboard_backend_detected(pyperclip)
+    if detected is not None:
+        if not detected:
+            _warn_clipboard_unavailable()
+        return detected
+
     # Attempt copy to trigger pyperclip's lazy detection and verify it works.
     # Note: is_available() returns False before any copy/paste call until asweigart/pyperclip#289 is fixed.
     previous_clipboard = None
@@ -175,13 +314,7 @@ def _check_clipboard() -> bool:
         pyperclip.copy("")
         probe_succeeded = True
     except pyperclip.PyperclipException:
-        platform = get_platform()
-        if platform == "linux":
-            _print_warn(
-                "Clipboard backend unavailable; install xclip/xsel or wl-clipboard."
-            )
-        else:
-            _print_warn("Clipboard backend unavailable on this system.")
+        _warn_clipboard_unavailable()
         return False
     finally:
         if probe_succeeded and previous_clipboard is not None:
@@ -193,6 +326,31 @@ def _check_clipboard() -> bool:
     return True
 
 
+def _clipboard_backend_detected(pyperclip: Any) -> bool | None:
+    """Ask pyperclip which backend it would use, without running it.
+
+    This avoids the paste/copy/copy round trip (three xclip/wl-copy
+    processes on Linux). Returns None when detection isn't possible, in
+    which case the caller falls back to the round trip.
+    """
+    determine = getattr(pyperclip, "determine_clipboard", None)
+    if determine is None:
+        return None
+    try:
+        copy, _paste = determine()
+    except Exception:
+        return None
+    # pyperclip's "no clipboard" stand-ins are falsy.
+    return bool(copy)
+
+
+def _warn_clipboard_unavailable() -> None:
+    if get_platform() == "linux":
+        _print_warn("Clipboard backend unavailable; install xclip/xsel or wl-clipboard.")
+    else:
+        _print_warn("Clipboard backend unavailable on this system.")
+
+
 def _check_platform_requirements() -> None:
     platform = get_platform()
     if platform == "macos":
@@ -208,7 +366,7 @@ def _check_platform_requirements() -> None:
             _print_warn("Use native Windows or a full Linux desktop session.")
         if is_wayland():
             _print_warn("Wayland detected; hotkeys/injection may be limited.")
-        if shutil.which("xdotool") is None:
+        if _which("xdotool") is None:
             _print_warn("xdotool not found; window focus restore disabled.")
             _print_warn("Install: sudo apt install xdotool (Debian/Ubuntu).")
     elif platform == "windows":
@@ -217,7 +375,7 @@ def _check_platform_requirements() -> None:
 
 def _dependency_hint(extra: str | None = None) -> str:
     plugin_root = "$CLAUDE_PLUGIN_ROOT"
-    if shutil.which("uv"):
+    if _which("uv"):
         cmd = f"uv sync --directory {plugin_root}"
         if extra:
             cmd = f"{cmd} --extra {extra}"
@@ -237,7 +395,22 @@ def _audio_backend_hint() -> str | None:
     return None
 
 
-def _ensure_engine_ready(config: Config, skip_model_download: bool) -> bool:
+def _engine_identity(config: Config, engine: Any) -> dict:
+    """What a successful model load depends on, for the engine-ready marker."""
+    return {
+        "engine": config.engine,
+        "model": getattr(engine, "model_name", None),
+        "device": getattr(engine, "device", None),
+        "compute_type": getattr(engine, "compute_type", None),
+        "version": __version__,
+    }
+
+
+def _ensure_engine_ready(
+    config: Config, skip_model_download: bool, revalidate: bool = False
+) -> bool:
+    from .engine_factory import build_engine
+
     try:
         engine = build_engine(config)
     except EngineError as exc:
@@ -260,59 +433,48 @@ def _ensure_engine_ready(config: Config, skip_model_download: bool) -> bool:
     if skip_model_download:
         return True
 
+    identity = _engine_identity(config, engine)
+    if not revalidate and _read_setup_marker(_ENGINE_OK_FILE) == identity:
+        _print_info("Model ready (loaded by a previous setup).")
+        return True
+
     _print_info("Loading STT model (first run may download)...")
     if engine.load_model():
+        _write_setup_marker(_ENGINE_OK_FILE, identity)
         _print_info("Model ready.")
         return True
     _print_error("Model failed to load.")
     return False
 
 
-def _spawn_daemon(plugin_root: Path) -> bool:
-    if is_daemon_running():
-        _print_info("Daemon already running.")
-        return True
-
-    log_file = Config.get_config_dir() / "daemon.log"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
+def _precompile_modules() -> None:
+    """Write bytecode for the whole package so the daemon starts from .pyc.
 
-    env = os.environ.copy()
-    env.setdefault("CLAUDE_PLUGIN_ROOT", str(plugin_root))
-    cmd = [
-        sys.executable,
-        "-m",
-        "claude_stt.daemon",
-        "run",
-    ]
-
-    creationflags = 0
-    if os.name == "nt":
-        creationflags |= getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
-        creationflags |= getattr(subprocess, "DETACHED_PROCESS", 0)
+    Setup only imports what its checks need; modules it never touched would
+    otherwise be compiled on the daemon's first start. Failures (e.g. a
+    read-only install) are ignored: Python just compiles at import time.
+    """
+    import compileall
 
     try:
-        with open(log_file, "a", encoding="utf-8") as log_handle:
-            subprocess.Popen(
-                cmd,
-                cwd=str(plugin_root),
-                env=env,
-                stdout=log_handle,
-                stderr=log_handle,
-                stdin=subprocess.DEVNULL,
-                start_new_session=os.name != "nt",
-                creationflags=creationflags,
-            )
+        if compileall.compile_dir(_PACKAGE_DIR, quiet=1):
+            _print_info("Precompiled bytecode.")
     except Exception:
-        logging.getLogger(__name__).exception("Failed to start daemon")
-        return False
+        logging.getLogger(__name__).debug("Bytecode precompile failed", exc_info=True)
+
+
+def _spawn_daemon(plugin_root: Path) -> bool:
+    from .daemon import get_log_file, is_daemon_running, spawn_background
+
+    if is_daemon_running():
+        _print_info("Daemon already running.")
+        return True
 
-    for _ in range(30):
-        if is_daemon_running():
-            _print_info("Daemon started.")
-            return True
-        time.sleep(0.1)
+    if spawn_background(plugin_root):
+        _print_info("Daemon started.")
+        return True
 
-    _print_warn(f"Daemon start not confirmed. Check logs: {log_file}")
+    _print_warn(f"Daemon start not confirmed. Check logs: {get_log_file()}")
     _print_warn("Run /claude-stt:start to retry.")
     return False
 
@@ -330,20 +492,45 @@ def run_setup(args: argparse.Namespace) -> int:
     config = _ensure_config()
     if config is None:
         return 1
-    _check_platform_requirements()
-
-    if not args.skip_audio_test and not _check_audio():
-        return 1
+    # The checks are independent, so run them side by side and print their
+    # output in the usual order. The hotkey check stays on the main thread
+    # (pynput needs it on macOS); the model loads in the background after it.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        submit = _Deferred if args.serial_probes else pool.submit
+        platform_check = submit(_captured, _check_platform_requirements)
+        audio_check = None
+        if not args.skip_audio_test:
+            audio_check = submit(_captured, _check_audio)
+        clipboard_check = submit(_captured, _check_clipboard)
+
+        _flush(platform_check.result())
+        if audio_check is not None and not _flush(audio_check.result()):
+            return 1
+
+        if args.skip_hotkey_test:
+            _print_warn("Skipping hotkey test.")
+        elif not _check_hotkey(
+            config, force=args.force_hotkey_test, strict=args.strict_hotkey_test
+        ):
+            return 1
+
+        # Only start the model load once nothing can fail before it; leaving
+        # the pool early would otherwise wait on a download nobody reports.
+        engine_check = submit(
+            _captured,
+            _ensure_engine_ready,
+            config,
+            skip_model_download=args.skip_model_download,
+            revalidate=args.revalidate_model,
+        )
 
-    if args.skip_hotkey_test:
-        _print_warn("Skipping hotkey test.")
-    elif not _check_hotkey(config):
-        return 1
+        _flush(clipboard_check.result())
 
-    _check_clipboard()
+        if not _flush(engine_check.result()):
+            return 1
 
-    if not _ensure_engine_ready(config, skip_model_download=args.skip_model_download):
-        return 1
+    if not args.no_precompile:
+        _precompile_modules()
 
     if not args.no_start:
         _spawn_daemon(plugin_root)
@@ -364,6 +551,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip downloading/loading the STT model.",
     )
+    parser.add_argument(
+        "--revalidate-model",
+        action="store_true",
+        help="Load the STT model even if a previous setup already did.",
+    )
     parser.add_argument(
         "--skip-audio-test",
         action="store_true",
@@ -374,6 +566,26 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip hotkey listener checks.",
     )
+    parser.add_argument(
+        "--force-hotkey-test",
+        action="store_true",
+        help="Run the hotkey listener check even if it passed recently.",
+    )
+    parser.add_argument(
+        "--strict-hotkey-test",
+        action="store_true",
+        help="Start a real hotkey listener instead of only checking prerequisites.",
+    )
+    parser.add_argument(
+        "--serial-probes",
+        action="store_true",
+        help="Run setup checks one at a time (for debugging).",
+    )
+    parser.add_argument(
+        "--no-precompile",
+        action="store_true",
+        help="Do not precompile package bytecode (for packagers).",
+    )
     parser.add_argument(
         "--no-start",
         action="store_true",
@@ -1,14 +1,16 @@
 """Audio feedback using native system sounds."""
 
+import functools
 import logging
 import os
 import platform
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 SoundEvent = Literal["start", "stop", "complete", "error", "warning"]
+SOUND_EVENTS: tuple[SoundEvent, ...] = ("start", "stop", "complete", "error", "warning")
 _logger = logging.getLogger(__name__)
 
 # macOS system sounds
@@ -36,72 +38,83 @@ def play_sound(event: SoundEvent) -> None:
     Args:
         event: The type of sound event to play.
     """
-    system = platform.system()
-
     try:
-        if system == "Darwin":
-            _play_macos_sound(event)
-        elif system == "Linux":
-            _play_linux_sound(event)
-        elif system == "Windows":
+        if platform.system() == "Windows":
             _play_windows_sound(event)
+            return
+        command = _sound_command(event)
+        if command:
+            subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
     except Exception:
         # Silently fail if sound playback doesn't work
         pass
 
 
-def _play_macos_sound(event: SoundEvent) -> None:
-    """Play sound on macOS using afplay."""
+def preload_sounds(events: tuple[SoundEvent, ...] = SOUND_EVENTS) -> None:
+    """Resolve player commands up front so playback is a single spawn.
+
+    Args:
+        events: Sound events to resolve.
+    """
+    if platform.system() == "Windows":
+        return
+    for event in events:
+        try:
+            _sound_command(event)
+        except Exception:
+            _logger.debug("Failed to resolve sound %s", event, exc_info=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _sound_command(event: SoundEvent) -> Optional[list[str]]:
+    """Player command for event; file and player lookups run once per event."""
+    system = platform.system()
+    if system == "Darwin":
+        return _macos_sound_command(event)
+    if system == "Linux":
+        return _linux_sound_command(event)
+    return None
+
+
+def _macos_sound_command(event: SoundEvent) -> Optional[list[str]]:
+    """Build the afplay command for event on macOS."""
     sound_file = MACOS_SOUNDS.get(event)
     if not sound_file:
-        return
+        return None
     if not Path(sound_file).exists():
         _logger.debug("Sound file missing: %s", sound_file)
-        return
+        return None
     if shutil.which("afplay") is None:
         _logger.debug("afplay not available")
-        return
-    subprocess.Popen(
-        ["afplay", sound_file],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+        return None
+    return ["afplay", sound_file]
 
 
-def _play_linux_sound(event: SoundEvent) -> None:
-    """Play sound on Linux using pw-play, paplay, or aplay."""
+def _linux_sound_command(event: SoundEvent) -> Optional[list[str]]:
+    """Build a pw-play, paplay, or aplay command for event on Linux."""
     sound_file = LINUX_SOUNDS.get(event)
     if not sound_file:
-        return
+        return None
     if not Path(sound_file).exists():
         _logger.debug("Sound file missing: %s", sound_file)
-        return
+        return None
 
     # Try pw-play first (PipeWire native) when the PipeWire socket is present
     if shutil.which("pw-play") and _pipewire_socket_available():
-        subprocess.Popen(
-            ["pw-play", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return
+        return ["pw-play", sound_file]
 
     # Try paplay (PulseAudio)
     if shutil.which("paplay"):
-        subprocess.Popen(
-            ["paplay", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return
+        return ["paplay", sound_file]
 
     # Fall back to aplay (ALSA) - note: may not support .oga files
     if shutil.which("aplay"):
-        subprocess.Popen(
-            ["aplay", "-q", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        return ["aplay", "-q", sound_file]
+    return None
 
 
 def _pipewire_socket_available() -> bool:
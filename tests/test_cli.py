@@ -1,6 +1,7 @@
 import contextlib
 import io
 import unittest
+from unittest import mock
 
 from claude_stt import __version__
 from claude_stt import cli
@@ -14,6 +15,18 @@ class CliTests(unittest.TestCase):
         self.assertEqual(exit_code, 0)
         self.assertEqual(buffer.getvalue().strip(), __version__)
 
+    def test_direct_command_dispatches_to_daemon(self) -> None:
+        with mock.patch("claude_stt.daemon.main", return_value=0) as daemon_main:
+            self.assertEqual(cli.main(["start", "--background"]), 0)
+            self.assertEqual(cli.main(["daemon", "toggle"]), 0)
+        daemon_main.assert_has_calls(
+            [mock.call(["start", "--background"]), mock.call(["toggle"])]
+        )
+
+    def test_bare_daemon_command_prints_help(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(cli.main(["daemon"]), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,10 @@
+import os
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
+from claude_stt import config as config_module
 from claude_stt.config import Config
 
 
@@ -21,6 +26,47 @@ class ConfigTests(unittest.TestCase):
         self.assertEqual(config.max_recording_seconds, 1)
         self.assertEqual(config.sample_rate, 16000)
 
+    def test_load_reparses_after_config_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            try:
+                config_path = Path(temp_dir) / "config.toml"
+                config_path.write_text('[claude-stt]\nhotkey = "f8"\n')
+                first = Config.load()
+                self.assertEqual(first.hotkey, "f8")
+
+                # Mutating a loaded config must not leak into later loads.
+                first.hotkey = "f9"
+                self.assertEqual(Config.load().hotkey, "f8")
+
+                config_path.write_text('[claude-stt]\nhotkey = "f10"\nmode = "toggle"\n')
+                self.assertEqual(Config.load().hotkey, "f10")
+            finally:
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
+    def test_load_uses_on_disk_cache_without_parsing_toml(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            try:
+                config_path = Path(temp_dir) / "config.toml"
+                config_path.write_text('[claude-stt]\nhotkey = "f7"\n')
+                self.assertEqual(Config.load().hotkey, "f7")
+                self.assertTrue((Path(temp_dir) / "config.cache.json").exists())
+
+                # Simulate a fresh process that cannot parse TOML.
+                with mock.patch.object(config_module, "_CONFIG_CACHE", None), mock.patch.object(
+                    config_module, "_get_tomli", return_value=None
+                ):
+                    self.assertEqual(Config.load().hotkey, "f7")
+
+                # A cache written by another release is not trusted.
+                with mock.patch.object(config_module, "_CONFIG_CACHE", None), mock.patch.object(
+                    config_module, "__version__", "0.0.0-other"
+                ), mock.patch.object(config_module, "_get_tomli", return_value=None):
+                    self.assertEqual(Config.load().hotkey, Config.hotkey)
+            finally:
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
 
 if __name__ == "__main__":
     unittest.main()
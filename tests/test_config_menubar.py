@@ -42,6 +42,13 @@ class ConfigMenuBarTests(unittest.TestCase):
 class EffectiveMenuBarTests(unittest.TestCase):
     """Tests for effective_menu_bar() method."""
 
+    def setUp(self):
+        # Platform checks are cached; forget them around each patched test.
+        from claude_stt import platform
+
+        platform.reset_cache()
+        self.addCleanup(platform.reset_cache)
+
     def test_effective_menu_bar_false_when_config_disabled(self):
         """effective_menu_bar() returns False when menu_bar=False."""
         from claude_stt.config import Config
@@ -52,11 +59,6 @@ class EffectiveMenuBarTests(unittest.TestCase):
     def test_effective_menu_bar_false_on_linux(self):
         """effective_menu_bar() returns False on Linux even if config=True."""
         with mock.patch.object(sys, "platform", "linux"):
-            from claude_stt import platform
-            import importlib
-
-            importlib.reload(platform)
-
             from claude_stt.config import Config
 
             config = Config(menu_bar=True)
@@ -65,11 +67,6 @@ class EffectiveMenuBarTests(unittest.TestCase):
     def test_effective_menu_bar_false_on_windows(self):
         """effective_menu_bar() returns False on Windows even if config=True."""
         with mock.patch.object(sys, "platform", "win32"):
-            from claude_stt import platform
-            import importlib
-
-            importlib.reload(platform)
-
             from claude_stt.config import Config
 
             config = Config(menu_bar=True)
@@ -80,11 +77,6 @@ class EffectiveMenuBarTests(unittest.TestCase):
         with mock.patch.object(sys, "platform", "darwin"):
             mock_rumps = mock.MagicMock()
             with mock.patch.dict(sys.modules, {"rumps": mock_rumps}):
-                from claude_stt import platform
-                import importlib
-
-                importlib.reload(platform)
-
                 from claude_stt.config import Config
 
                 config = Config(menu_bar=True)
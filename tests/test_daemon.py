@@ -1,6 +1,9 @@
 import os
+import subprocess
+import sys
 import tempfile
 import unittest
+from unittest import mock
 
 from claude_stt import daemon
 
@@ -39,12 +42,122 @@ class DaemonPidTests(unittest.TestCase):
             try:
                 daemon._write_pid_file(os.getpid())
                 daemon._get_process_command = lambda pid: "python other-process"
-                self.assertFalse(daemon.is_daemon_running())
+                with mock.patch.object(daemon, "_verify_pid_identity", return_value=None):
+                    self.assertFalse(daemon.is_daemon_running())
                 self.assertFalse(daemon.get_pid_file().exists())
             finally:
                 daemon._get_process_command = original_get_process_command
                 os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
 
+    @unittest.skipUnless(os.path.isdir("/proc/self"), "requires procfs")
+    def test_own_pid_file_verified_without_command_lookup(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            try:
+                daemon._write_pid_file(os.getpid())
+                with mock.patch.object(daemon, "_get_process_command") as lookup:
+                    self.assertTrue(daemon.is_daemon_running())
+                    lookup.assert_not_called()
+                data = daemon._read_pid_file()
+                data["created_at"] = 0
+                self.assertIsNone(daemon._verify_pid_identity(os.getpid(), data))
+            finally:
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
+    def test_stop_skips_command_lookup_for_verified_pid(self):
+        data = {"pid": 4242, "exe": "/usr/bin/python3", "created_at": 0}
+        with mock.patch.object(daemon, "_read_pid_file", return_value=data), \
+            mock.patch.object(daemon, "_pid_exists", return_value=True), \
+            mock.patch.object(daemon, "_verify_pid_identity", return_value=True), \
+            mock.patch.object(daemon, "_get_process_command") as lookup, \
+            mock.patch.object(daemon, "_terminate_process", return_value=True) as term, \
+            mock.patch.object(daemon, "_wait_for_exit", return_value=True), \
+            mock.patch.object(daemon, "_remove_pid_file"):
+            daemon.stop_daemon()
+        lookup.assert_not_called()
+        term.assert_called_once_with(4242)
+
+    def test_wait_for_exit(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            self.assertFalse(daemon._wait_for_exit(proc.pid, 0.05))
+            proc.terminate()
+            # Reap it so the pid doesn't linger as a zombie.
+            proc.wait(timeout=5)
+            self.assertTrue(daemon._wait_for_exit(proc.pid, 1.0))
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+    @unittest.skipIf(os.name == "nt", "ready pipe is POSIX-only")
+    def test_ready_pipe_signals_start(self):
+        ready = daemon._open_ready_pipe()
+        script = (
+            "import sys, time; from claude_stt import daemon; "
+            "daemon._notify_ready(int(sys.argv[1])); time.sleep(5)"
+        )
+        proc = subprocess.Popen(
+            [sys.executable, "-c", script, *daemon._ready_fd_args(ready)[1:]],
+            pass_fds=ready[1:],
+        )
+        try:
+            with mock.patch.object(daemon, "is_daemon_running") as running:
+                self.assertTrue(daemon._wait_for_daemon_start(ready, 5.0))
+            running.assert_not_called()
+        finally:
+            proc.kill()
+            proc.wait()
+
+    @unittest.skipIf(os.name == "nt", "ready pipe is POSIX-only")
+    def test_ready_pipe_eof_falls_back_to_pid_check(self):
+        ready = daemon._open_ready_pipe()
+        proc = subprocess.Popen([sys.executable, "-c", "pass"], pass_fds=ready[1:])
+        proc.wait()
+        with mock.patch.object(daemon, "is_daemon_running", return_value=False) as running:
+            self.assertFalse(daemon._wait_for_daemon_start(ready, 5.0))
+        running.assert_called_once()
+
+    def test_spawn_background_runs_from_plugin_root(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = daemon.Path(temp_dir)
+            log_file = root / "logs" / "daemon.log"
+            with mock.patch.object(daemon.subprocess, "Popen") as popen, mock.patch.object(
+                daemon, "_wait_for_daemon_start", return_value=True
+            ) as wait:
+                self.assertTrue(daemon.spawn_background(root, log_file))
+            self.assertTrue(log_file.exists())
+        kwargs = popen.call_args.kwargs
+        self.assertEqual(kwargs["cwd"], str(root))
+        self.assertEqual(popen.call_args.args[0][1:4], ["-m", "claude_stt.daemon", "run"])
+        ready = wait.call_args.args[0]
+        if ready is not None:
+            self.assertEqual(kwargs["pass_fds"], ready[1:])
+            daemon._close_ready_pipe(ready)
+
+    def test_pid_file_path_follows_config_dir(self):
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            try:
+                os.environ["CLAUDE_STT_CONFIG_DIR"] = first
+                self.assertEqual(daemon.get_pid_file().parent, daemon.Path(first))
+                os.environ["CLAUDE_STT_CONFIG_DIR"] = second
+                self.assertEqual(daemon.get_pid_file().parent, daemon.Path(second))
+            finally:
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
+    def test_process_command_lookups_are_reused_briefly(self):
+        daemon._invalidate_pid_caches()
+        with mock.patch.object(
+            daemon, "_query_process_command", return_value="python -m claude_stt.daemon run"
+        ) as query:
+            daemon._get_process_command(12345)
+            daemon._get_process_command(12345)
+            self.assertEqual(query.call_count, 1)
+            daemon._invalidate_pid_caches()
+            daemon._get_process_command(12345)
+            self.assertEqual(query.call_count, 2)
+        daemon._invalidate_pid_caches()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,226 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from claude_stt import daemon_service
+from claude_stt.config import Config
+from claude_stt.daemon_service import STTDaemon
+
+
+class NextWakeupTests(unittest.TestCase):
+    def _daemon(self, max_seconds: int) -> STTDaemon:
+        return STTDaemon(Config(max_recording_seconds=max_seconds, sound_effects=False))
+
+    def test_idle_daemon_uses_idle_wait(self):
+        daemon = self._daemon(300)
+        self.assertEqual(daemon._next_wakeup(), daemon_service._IDLE_WAIT_SECONDS)
+
+    def test_recording_wakes_for_warning_then_max(self):
+        daemon = self._daemon(300)
+        daemon._recording = True
+
+        daemon._record_start_time = time.monotonic() - 10
+        daemon._warning_deadline = daemon._record_start_time + 270
+        self.assertAlmostEqual(daemon._next_wakeup(), 260, delta=1)
+
+        # Once the warning has fired only the max deadline is left.
+        daemon._warning_deadline = None
+        self.assertAlmostEqual(daemon._next_wakeup(), 290, delta=1)
+
+    def test_warning_fires_once(self):
+        daemon = STTDaemon(Config(max_recording_seconds=300, sound_effects=True))
+        daemon._recording = True
+        daemon._record_start_time = time.monotonic() - 280
+        daemon._warning_deadline = daemon._record_start_time + 270
+        with mock.patch.object(daemon_service, "play_sound") as play:
+            daemon._check_max_recording_time()
+            daemon._check_max_recording_time()
+        play.assert_called_once_with("warning")
+        self.assertIsNone(daemon._warning_deadline)
+
+    def test_full_recorder_stops_before_deadline(self):
+        daemon = STTDaemon(Config(max_recording_seconds=300, sound_effects=False))
+        daemon._recording = True
+        daemon._record_start_time = time.monotonic()
+        daemon._waker.open()
+        self.addCleanup(daemon._waker.close)
+        daemon._on_recorder_full()
+        self.assertTrue(daemon._waker.wait(0))
+        with mock.patch.object(daemon, "_on_recording_stop") as stop:
+            daemon._check_max_recording_time()
+        stop.assert_called_once_with()
+
+    def test_short_max_skips_warning(self):
+        daemon = self._daemon(20)
+        daemon._recording = True
+        daemon._record_start_time = time.monotonic() - 5
+        self.assertAlmostEqual(daemon._next_wakeup(), 15, delta=1)
+
+
+class HeadlessLoopTests(unittest.TestCase):
+    def test_stop_event_ends_idle_loop_promptly(self):
+        daemon = STTDaemon(Config(sound_effects=False))
+        self.addCleanup(daemon._waker.close)
+        thread = threading.Thread(target=daemon._run_headless, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        daemon._stop_event.set()
+        daemon._waker.wake()
+        thread.join(timeout=1.0)
+        self.assertFalse(thread.is_alive())
+
+    def test_shutdown_request_ends_loop_without_event_calls(self):
+        """Signal handlers only set a flag and wake; the loop does the rest."""
+        daemon = STTDaemon(Config(sound_effects=False))
+        self.addCleanup(daemon._waker.close)
+        thread = threading.Thread(target=daemon._run_headless, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        daemon._shutdown_requested = True
+        daemon._waker.wake()
+        thread.join(timeout=1.0)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(daemon._stop_event.is_set())
+        self.assertFalse(daemon._shutdown_requested)
+
+
+class HandleSignalsTests(unittest.TestCase):
+    def test_toggle_request_starts_then_stops(self):
+        daemon = STTDaemon(Config(sound_effects=False))
+        with mock.patch.object(daemon, "_on_recording_start") as start, mock.patch.object(
+            daemon, "_on_recording_stop"
+        ) as stop:
+            daemon._toggle_requested = True
+            daemon._handle_signals()
+            start.assert_called_once_with()
+            daemon._recording = True
+            daemon._toggle_requested = True
+            daemon._handle_signals()
+            stop.assert_called_once_with()
+            daemon._handle_signals()
+        self.assertEqual(start.call_count + stop.call_count, 2)
+        self.assertFalse(daemon._toggle_requested)
+
+
+class _FakeRecorder:
+    max_samples = None
+
+    def start(self, buffer=None):
+        return True
+
+    def stop(self, out=None):
+        return None
+
+
+class RecordingCallbackTests(unittest.TestCase):
+    def test_sounds_play_outside_lock(self):
+        daemon = STTDaemon(Config(sound_effects=True))
+        daemon._recorder = _FakeRecorder()
+        lock_held = []
+
+        def fake_play(name):
+            lock_held.append((name, daemon._lock.locked()))
+
+        with mock.patch.object(daemon_service, "play_sound", fake_play), mock.patch.object(
+            daemon_service, "get_active_window", return_value=None
+        ):
+            daemon._on_recording_start()
+            daemon._on_recording_stop()
+
+        self.assertEqual(
+            lock_held, [("start", False), ("stop", False), ("warning", False)]
+        )
+
+
+class AudioLevelTests(unittest.TestCase):
+    def test_matches_reference_rms(self):
+        audio = np.linspace(-0.5, 0.5, 16000, dtype=np.float32)
+        expected = 20 * np.log10(np.sqrt(np.mean(audio.astype(np.float64) ** 2)))
+        self.assertAlmostEqual(daemon_service._audio_level_db(audio), expected, places=3)
+
+    def test_integer_pcm_is_scaled_not_overflowed(self):
+        audio = np.full(1000, 16384, dtype=np.int16)
+        self.assertAlmostEqual(
+            daemon_service._audio_level_db(audio), 20 * np.log10(0.5), places=3
+        )
+
+    def test_silence_and_empty_are_floored(self):
+        self.assertAlmostEqual(
+            daemon_service._audio_level_db(np.zeros(10, dtype=np.float32)), -200.0
+        )
+        self.assertAlmostEqual(
+            daemon_service._audio_level_db(np.zeros(0, dtype=np.float32)), -200.0
+        )
+
+
+class CoalesceTests(unittest.TestCase):
+    def test_joins_recordings_for_same_window(self):
+        daemon = STTDaemon(Config(sample_rate=16000, max_recording_seconds=1))
+        first = np.ones(4000, dtype=np.float32)
+        second = np.zeros(4000, dtype=np.float32)
+        other = np.ones(100, dtype=np.float32)
+        window = daemon_service.WindowInfo(window_id="1", platform="linux")
+        other_window = daemon_service.WindowInfo(window_id="2", platform="linux")
+
+        batches = daemon._coalesce(
+            [(first, None, window), (second, None, window), (other, None, other_window)]
+        )
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(batches[0][0]), 8000)
+        self.assertEqual(batches[0][1], window)
+        self.assertIs(batches[1][0], other)
+
+    def test_respects_max_recording_length(self):
+        daemon = STTDaemon(Config(sample_rate=16000, max_recording_seconds=1))
+        audio = np.ones(10000, dtype=np.float32)
+        batches = daemon._coalesce([(audio, None, None), (audio, None, None)])
+        self.assertEqual(len(batches), 2)
+
+
+class SpscRingTests(unittest.TestCase):
+    def test_fifo_order_and_capacity(self):
+        ring = daemon_service._SpscRing(2)
+        self.assertTrue(ring.push("a"))
+        self.assertTrue(ring.push("b"))
+        self.assertFalse(ring.push("c"))
+        self.assertEqual(ring.pop(), "a")
+        self.assertTrue(ring.push("c"))
+        self.assertEqual(ring.pop(), "b")
+        self.assertEqual(ring.pop(), "c")
+
+    def test_pop_all_drains_pending_items(self):
+        ring = daemon_service._SpscRing(2)
+        ring.push("a")
+        ring.push("b")
+        self.assertEqual(ring.pop_all(), ["a", "b"])
+        self.assertTrue(ring.push("c"))
+        self.assertEqual(ring.pop(), "c")
+        ring.close()
+        self.assertEqual(ring.pop_all(), [])
+
+    def test_close_keeps_queued_items(self):
+        ring = daemon_service._SpscRing(2)
+        ring.push(1)
+        ring.push(2)
+        ring.close()
+        self.assertEqual(ring.pop_all(), [1, 2])
+        self.assertEqual(ring.pop_all(), [])
+
+    def test_close_wakes_blocked_consumer(self):
+        ring = daemon_service._SpscRing(2)
+        results = []
+        consumer = threading.Thread(target=lambda: results.append(ring.pop()))
+        consumer.start()
+        time.sleep(0.05)
+        ring.close()
+        consumer.join(timeout=1.0)
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(results, [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import os
 import queue
 import time
 import unittest
+from unittest import mock
 
 try:
     from pynput import keyboard
@@ -75,6 +77,19 @@ class HotkeyListenerTests(unittest.TestCase):
         with self.assertRaises(HotkeyError):
             HotkeyListener(hotkey="ctrl+unknownkey")
 
+    def test_can_start_needs_display_on_linux(self):
+        listener = HotkeyListener(hotkey="ctrl+shift+space")
+        with mock.patch("platform.system", return_value="Linux"), \
+            mock.patch.dict(os.environ, {"DISPLAY": ""}), \
+            mock.patch("os.access", return_value=False):
+            ok, reason = listener.can_start()
+        self.assertFalse(ok)
+        self.assertIn("DISPLAY", reason)
+
+        with mock.patch("platform.system", return_value="Linux"), \
+            mock.patch.dict(os.environ, {"DISPLAY": ":0"}):
+            self.assertEqual(listener.can_start(), (True, None))
+
 
 if __name__ == "__main__":
     unittest.main()
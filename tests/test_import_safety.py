@@ -1,10 +1,30 @@
 """Tests for import safety - ensuring no top-level rumps imports break Linux/Windows."""
 
 import ast
+import functools
 import unittest
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
+def _top_level_imports(filepath: Path) -> frozenset[str]:
+    """Parse a file once and return the names its top-level imports bring in."""
+    tree = ast.parse(filepath.read_text(encoding="utf-8"), filename=str(filepath))
+
+    imports = set()
+    for node in ast.iter_child_nodes(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.add(node.module)
+            # Also check the names being imported
+            for alias in node.names:
+                imports.add(alias.name)
+    return frozenset(imports)
+
+
 class ImportSafetyTests(unittest.TestCase):
     """Tests to ensure optional dependencies don't have top-level imports.
 
@@ -12,60 +32,23 @@ class ImportSafetyTests(unittest.TestCase):
     ensuring the daemon works on Linux/Windows where rumps isn't available.
     """
 
-    def _get_top_level_imports(self, filepath: Path) -> list[str]:
-        """Extract all top-level import names from a Python file."""
-        with open(filepath) as f:
-            tree = ast.parse(f.read())
-
-        imports = []
-        for node in ast.iter_child_nodes(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-                # Also check the names being imported
-                for alias in node.names:
-                    imports.append(alias.name)
-        return imports
-
-    def test_daemon_module_no_rumps_import(self):
-        """daemon.py should not have top-level rumps import."""
-        daemon_path = Path(__file__).parent.parent / "src" / "claude_stt" / "daemon.py"
-        imports = self._get_top_level_imports(daemon_path)
-
-        self.assertNotIn("rumps", imports)
-        self.assertNotIn(".menubar", imports)
-        self.assertNotIn("menubar", imports)
-
-    def test_daemon_service_no_rumps_import(self):
-        """daemon_service.py should not have top-level rumps import."""
-        daemon_service_path = (
-            Path(__file__).parent.parent / "src" / "claude_stt" / "daemon_service.py"
-        )
-        imports = self._get_top_level_imports(daemon_service_path)
-
-        self.assertNotIn("rumps", imports)
-        self.assertNotIn(".menubar", imports)
-        self.assertNotIn("menubar", imports)
-
-    def test_config_no_rumps_import(self):
-        """config.py should not have top-level rumps import."""
-        config_path = Path(__file__).parent.parent / "src" / "claude_stt" / "config.py"
-        imports = self._get_top_level_imports(config_path)
-
-        self.assertNotIn("rumps", imports)
-
-    def test_platform_no_rumps_import(self):
-        """platform.py should not have top-level rumps import."""
-        platform_path = (
-            Path(__file__).parent.parent / "src" / "claude_stt" / "platform.py"
-        )
-        imports = self._get_top_level_imports(platform_path)
-
-        # platform.py imports rumps inside menubar_available(), not at top level
-        self.assertNotIn("rumps", imports)
+    # (file under src/claude_stt, names it must not import at top level)
+    FORBIDDEN_TOP_LEVEL_IMPORTS = (
+        ("daemon.py", ("rumps", ".menubar", "menubar")),
+        ("daemon_service.py", ("rumps", ".menubar", "menubar")),
+        ("config.py", ("rumps",)),
+        # platform.py imports rumps lazily (via menubar_available()), not at top level
+        ("platform.py", ("rumps",)),
+    )
+
+    def test_no_rumps_top_level_imports(self):
+        """Modules loaded on every platform must not import rumps at top level."""
+        src_dir = (Path(__file__).parent.parent / "src" / "claude_stt").resolve()
+        for filename, forbidden in self.FORBIDDEN_TOP_LEVEL_IMPORTS:
+            imports = _top_level_imports(src_dir / filename)
+            for name in forbidden:
+                with self.subTest(file=filename, name=name):
+                    self.assertNotIn(name, imports)
 
 
 class ModuleImportTests(unittest.TestCase):
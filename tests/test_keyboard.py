@@ -1,4 +1,6 @@
+import subprocess
 import unittest
+from unittest import mock
 
 from claude_stt.config import Config
 from claude_stt import keyboard
@@ -32,5 +34,82 @@ class KeyboardOutputTests(unittest.TestCase):
             keyboard._injection_capable = original_capable
 
 
+class InjectionProbeTests(unittest.TestCase):
+    def test_success_is_sticky(self):
+        saved = (
+            keyboard._injection_sticky,
+            keyboard._injection_capable,
+            keyboard._injection_checked_at,
+        )
+        keyboard._injection_sticky = False
+        keyboard._injection_capable = None
+        keyboard._injection_checked_at = None
+        try:
+            with mock.patch.object(keyboard, "is_wayland", return_value=True), \
+                mock.patch.object(keyboard, "_has_wtype", return_value=True) as has_wtype:
+                self.assertTrue(keyboard.test_injection())
+                keyboard._injection_checked_at = -1e9  # well past the TTL
+                self.assertTrue(keyboard.test_injection())
+            has_wtype.assert_called_once()
+        finally:
+            (
+                keyboard._injection_sticky,
+                keyboard._injection_capable,
+                keyboard._injection_checked_at,
+            ) = saved
+
+
+class InjectionBackendTests(unittest.TestCase):
+    def setUp(self):
+        keyboard._injection_backend.cache_clear()
+        self.addCleanup(keyboard._injection_backend.cache_clear)
+
+    def test_wayland_without_wtype_uses_clipboard(self):
+        with mock.patch.object(keyboard, "is_wayland", return_value=True), \
+            mock.patch.object(keyboard, "_has_wtype", return_value=False) as has_wtype, \
+            mock.patch.object(keyboard, "_output_via_clipboard", return_value=True) as clip:
+            config = Config(output_mode="injection")
+            self.assertTrue(keyboard.output_text("one", config=config))
+            self.assertTrue(keyboard.output_text("two", config=config))
+        has_wtype.assert_called_once()
+        self.assertEqual(clip.call_count, 2)
+
+
+class ChunkedTypingTests(unittest.TestCase):
+    def test_text_typed_in_order_in_chunks(self):
+        kb = mock.Mock()
+        text = "x" * (keyboard._TYPE_CHUNK_CHARS * 2 + 5)
+        keyboard._type_in_chunks(kb, text)
+        typed = [call.args[0] for call in kb.type.call_args_list]
+        self.assertEqual(len(typed), 3)
+        self.assertEqual("".join(typed), text)
+
+
+class StreamingTypingTests(unittest.TestCase):
+    def test_keyboard_resolved_once(self):
+        kb = mock.Mock()
+        original = keyboard._keyboard_type
+        keyboard._keyboard_type = None
+        try:
+            with mock.patch.object(keyboard, "get_keyboard", return_value=kb) as get_kb:
+                self.assertTrue(keyboard.type_text_streaming("hello "))
+                self.assertTrue(keyboard.type_text_streaming("world"))
+            get_kb.assert_called_once()
+            self.assertEqual(kb.type.call_count, 2)
+        finally:
+            keyboard._keyboard_type = original
+
+
+class WtypeOutputTests(unittest.TestCase):
+    def test_text_sent_on_stdin(self):
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"", stderr=b"")
+        with mock.patch.object(keyboard, "_wtype_path", return_value="/usr/bin/wtype"), \
+            mock.patch.object(keyboard.subprocess, "run", return_value=completed) as run:
+            self.assertTrue(keyboard._output_via_wtype("hello world", Config(sound_effects=False)))
+        args, kwargs = run.call_args
+        self.assertEqual(args[0], ["/usr/bin/wtype", "-"])
+        self.assertEqual(kwargs["input"], b"hello world")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -60,6 +60,49 @@ class STTMenuBarTests(unittest.TestCase):
         self.app.on_transcription_complete()
         self.assertEqual(self.app._status_item.title, "Status: Ready")
 
+    def test_background_updates_coalesce_onto_main_thread(self):
+        """Off-main-thread updates should collapse into one callAfter."""
+        with mock.patch("claude_stt.menubar.NSThread") as ns_thread, mock.patch(
+            "claude_stt.menubar.AppHelper"
+        ) as app_helper:
+            ns_thread.isMainThread.return_value = False
+            self.app.on_recording_start()
+            self.app.on_recording_stop()
+            app_helper.callAfter.assert_called_once_with(self.app._apply_pending_ui)
+            self.assertEqual(self.app._status_item.title, "Status: Ready")
+
+            self.app._apply_pending_ui()
+        self.assertEqual(self.app._status_item.title, "Status: Processing...")
+
+    def test_unchanged_state_skips_cocoa_update(self):
+        """Re-applying the current title and status should not touch the views."""
+        self.app._status_item = mock.MagicMock()
+        self.app._apply_ui(self.app.ICON_IDLE, "Status: Ready")
+        self.assertEqual(self.app._status_item.mock_calls, [])
+
+        self.app._apply_ui(self.app.ICON_RECORDING, "Status: Recording...")
+        self.assertEqual(self.app._status_item.title, "Status: Recording...")
+        self.assertEqual(self.app._applied_ui, (self.app.ICON_RECORDING, "Status: Recording..."))
+
+    def test_max_time_check_reschedules_for_next_deadline(self):
+        """The timer should fire again at the daemon's next deadline."""
+        self.mock_daemon._next_wakeup.return_value = 42.0
+        sender = mock.MagicMock()
+        with mock.patch("rumps.Timer") as timer_cls:
+            self.app._check_max_recording_time(sender)
+        sender.stop.assert_called_once()
+        self.mock_daemon._check_max_recording_time.assert_called_once()
+        timer_cls.assert_called_once_with(self.app._check_max_recording_time, 42.0)
+        timer_cls.return_value.start.assert_called_once()
+
+    def test_request_check_runs_on_main_thread(self):
+        """request_check should hand the max-time check to the main thread."""
+        with mock.patch("claude_stt.menubar.AppHelper") as app_helper:
+            self.app.request_check()
+        app_helper.callAfter.assert_called_once_with(
+            self.app._check_max_recording_time, None
+        )
+
     def test_stop_daemon_calls_daemon_stop(self):
         """'Stop Daemon' menu click should call daemon.stop()."""
         with mock.patch("rumps.quit_application"):
@@ -1,131 +1,78 @@
 """Tests for platform detection utilities."""
 
+import contextlib
+import importlib.util
 import sys
 import unittest
 from unittest import mock
 
+from claude_stt import platform
 
-class PlatformDetectionTests(unittest.TestCase):
-    """Tests for platform detection functions.
-
-    Note: These tests mock sys.platform at the function call level,
-    not by reloading the module, since the functions check platform
-    at call time, not import time.
-    """
-
-    def test_is_macos_returns_true_on_darwin(self):
-        """is_macos() should return True on macOS."""
-        from claude_stt.platform import is_macos
-
-        with mock.patch.object(sys, "platform", "darwin"):
-            self.assertTrue(is_macos())
-
-    def test_is_macos_returns_false_on_linux(self):
-        """is_macos() should return False on Linux."""
-        from claude_stt.platform import is_macos
-
-        with mock.patch.object(sys, "platform", "linux"):
-            self.assertFalse(is_macos())
-
-    def test_is_macos_returns_false_on_windows(self):
-        """is_macos() should return False on Windows."""
-        from claude_stt.platform import is_macos
-
-        with mock.patch.object(sys, "platform", "win32"):
-            self.assertFalse(is_macos())
-
-    def test_is_linux_returns_true_on_linux(self):
-        """is_linux() should return True on Linux."""
-        from claude_stt.platform import is_linux
-
-        with mock.patch.object(sys, "platform", "linux"):
-            self.assertTrue(is_linux())
-
-    def test_is_linux_returns_false_on_darwin(self):
-        """is_linux() should return False on macOS."""
-        from claude_stt.platform import is_linux
 
-        with mock.patch.object(sys, "platform", "darwin"):
-            self.assertFalse(is_linux())
-
-    def test_is_windows_returns_true_on_win32(self):
-        """is_windows() should return True on Windows."""
-        from claude_stt.platform import is_windows
-
-        with mock.patch.object(sys, "platform", "win32"):
-            self.assertTrue(is_windows())
-
-    def test_is_windows_returns_false_on_darwin(self):
-        """is_windows() should return False on macOS."""
-        from claude_stt.platform import is_windows
-
-        with mock.patch.object(sys, "platform", "darwin"):
-            self.assertFalse(is_windows())
+@contextlib.contextmanager
+def _platform_as(value):
+    """Run claude_stt.platform's checks as if on the given sys.platform."""
+    platform.reset_cache()
+    try:
+        with mock.patch.object(sys, "platform", value):
+            yield platform
+    finally:
+        platform.reset_cache()
 
-    def test_menubar_available_false_on_linux(self):
-        """menubar_available() should return False on Linux."""
-        from claude_stt.platform import menubar_available
 
-        with mock.patch.object(sys, "platform", "linux"):
-            self.assertFalse(menubar_available())
+class PlatformDetectionTests(unittest.TestCase):
+    """Tests for platform detection functions.
 
-    def test_menubar_available_false_on_windows(self):
-        """menubar_available() should return False on Windows."""
-        from claude_stt.platform import menubar_available
+    The checks are cached, so each case clears the cache around its patched
+    sys.platform.
+    """
 
-        with mock.patch.object(sys, "platform", "win32"):
-            self.assertFalse(menubar_available())
+    CASES = (
+        ("is_macos", "darwin", True),
+        ("is_macos", "linux", False),
+        ("is_macos", "win32", False),
+        ("is_linux", "linux", True),
+        ("is_linux", "darwin", False),
+        ("is_windows", "win32", True),
+        ("is_windows", "darwin", False),
+        ("menubar_available", "linux", False),
+        ("menubar_available", "win32", False),
+    )
 
+    def test_platform_checks(self):
+        """Each check should match only its own sys.platform value."""
+        for name, value, expected in self.CASES:
+            with self.subTest(check=name, platform=value), _platform_as(value) as module:
+                self.assertIs(getattr(module, name)(), expected)
 
-def _rumps_available() -> bool:
-    """Check if rumps is importable."""
-    try:
-        import rumps  # noqa: F401
 
-        return True
-    except ImportError:
-        return False
+# find_spec locates rumps without executing it (and pulling in AppKit); only
+# bother on macOS, where the test can run at all.
+_RUMPS_AVAILABLE = sys.platform == "darwin" and importlib.util.find_spec("rumps") is not None
 
 
 class MenubarAvailabilityOnMacOSTests(unittest.TestCase):
     """Tests for menubar_available() specifically on macOS."""
 
-    @unittest.skipUnless(
-        sys.platform == "darwin" and _rumps_available(),
-        "Requires macOS and rumps installed",
-    )
+    @unittest.skipUnless(_RUMPS_AVAILABLE, "Requires macOS and rumps installed")
     def test_menubar_available_true_when_rumps_installed(self):
         """On macOS with rumps installed, should return True."""
-        from claude_stt.platform import menubar_available
-
-        self.assertTrue(menubar_available())
+        self.assertTrue(platform.menubar_available())
 
+    # A None entry in sys.modules makes `import rumps` raise ImportError.
+    @mock.patch.dict(sys.modules, {"rumps": None})
     def test_menubar_available_false_when_rumps_not_importable(self):
         """On macOS without rumps, should return False."""
-        from claude_stt.platform import menubar_available
-
-        # Mock is_macos to return True, but make rumps import fail
-        with mock.patch("claude_stt.platform.is_macos", return_value=True):
-            # Mock the import to fail
-            original_import = __import__
-
-            def mock_import(name, *args, **kwargs):
-                if name == "rumps":
-                    raise ImportError("No module named 'rumps'")
-                return original_import(name, *args, **kwargs)
-
-            with mock.patch("builtins.__import__", mock_import):
-                # Clear rumps from sys.modules to force reimport
-                saved_rumps = sys.modules.pop("rumps", None)
-                try:
-                    # Need to call the function fresh
-                    _ = menubar_available()
-                    # On actual macOS with rumps, this might still return True
-                    # because rumps was already imported. The test is more about
-                    # verifying the logic path.
-                finally:
-                    if saved_rumps:
-                        sys.modules["rumps"] = saved_rumps
+        with _platform_as("darwin") as module:
+            self.assertFalse(module.menubar_available())
+
+    @mock.patch.object(platform, "_rumps_importable", return_value=False)
+    def test_menubar_available_is_remembered(self, importable):
+        """The rumps import should only be attempted once."""
+        with _platform_as("darwin") as module:
+            module.menubar_available()
+            module.menubar_available()
+        importable.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from claude_stt import recorder as recorder_module
+from claude_stt.recorder import AudioRecorder, RecorderConfig
+
+
+class AudioRecorderStopTests(unittest.TestCase):
+    def _recorder_with_chunks(self, *chunks: np.ndarray, **config) -> AudioRecorder:
+        config.setdefault("max_recording_seconds", 1)
+        recorder = AudioRecorder(RecorderConfig(blocksize=4, **config))
+        recorder._reset_buffers()
+        for chunk in chunks:
+            recorder._on_audio(chunk, len(chunk), None, None)
+        recorder._recording = True
+        recorder._stream = mock.MagicMock()
+        return recorder
+
+    def test_stop_fills_preallocated_buffer(self):
+        chunks = [np.full((4, 1), i, dtype=np.float32) for i in range(3)]
+        recorder = self._recorder_with_chunks(*chunks)
+        out = np.zeros(recorder.max_samples, dtype=np.float32)
+
+        audio = recorder.stop(out=out)
+
+        self.assertIs(audio.base, out)
+        np.testing.assert_array_equal(audio, np.repeat([0, 1, 2], 4).astype(np.float32))
+
+    def test_stop_allocates_when_buffer_too_small(self):
+        recorder = self._recorder_with_chunks(np.ones((4, 1), dtype=np.float32))
+        out = np.zeros(2, dtype=np.float32)
+
+        audio = recorder.stop(out=out)
+
+        self.assertIsNot(audio.base, out)
+        self.assertEqual(audio.shape, (4,))
+
+    def test_ring_keeps_newest_frames_in_order(self):
+        # 8 Hz * 1 s = two 4-frame blocks of capacity.
+        chunks = [np.full((4, 1), i, dtype=np.float32) for i in range(3)]
+        recorder = self._recorder_with_chunks(*chunks, sample_rate=8)
+
+        audio = recorder.stop()
+
+        np.testing.assert_array_equal(audio, np.repeat([1, 2], 4).astype(np.float32))
+
+    def test_on_full_fires_once_when_ring_fills(self):
+        recorder = self._recorder_with_chunks(sample_rate=8)
+        recorder.on_full = mock.Mock()
+        for i in range(3):
+            recorder._on_audio(np.full((4, 1), i, dtype=np.float32), 4, None, None)
+            self.assertEqual(recorder.on_full.call_count, 0 if i == 0 else 1)
+
+    def test_unbounded_recording_uses_chunks(self):
+        chunks = [np.full((4, 1), i, dtype=np.float32) for i in range(2)]
+        recorder = self._recorder_with_chunks(*chunks, max_recording_seconds=None)
+
+        audio = recorder.stop()
+
+        np.testing.assert_array_equal(audio, np.repeat([0, 1], 4).astype(np.float32))
+
+    def test_int16_capture_is_scaled_to_float32(self):
+        chunk = np.array([[0], [16384], [-32768], [32767]], dtype=np.int16)
+        expected = np.array([0.0, 0.5, -1.0, 32767 / 32768], dtype=np.float32)
+
+        for max_seconds in (1, None):
+            recorder = self._recorder_with_chunks(
+                chunk, dtype="int16", sample_rate=8, max_recording_seconds=max_seconds
+            )
+            audio = recorder.stop()
+            self.assertEqual(audio.dtype, np.float32)
+            np.testing.assert_allclose(audio, expected)
+
+        recorder = self._recorder_with_chunks(chunk, dtype="int16", sample_rate=8)
+        out = np.zeros(recorder.max_samples, dtype=np.float32)
+        np.testing.assert_allclose(recorder.stop(out=out), expected)
+
+
+class AudioRecorderBorrowedBufferTests(unittest.TestCase):
+    def _record(self, buffer, *chunks):
+        recorder = AudioRecorder(
+            RecorderConfig(sample_rate=8, blocksize=4, max_recording_seconds=1)
+        )
+        recorder._reset_buffers(buffer)
+        for chunk in chunks:
+            recorder._on_audio(chunk, len(chunk), None, None)
+        recorder._recording = True
+        recorder._stream = mock.MagicMock()
+        return recorder
+
+    def test_unwrapped_recording_returns_view_of_buffer(self):
+        buffer = np.zeros(8, dtype=np.float32)
+        recorder = self._record(buffer, np.ones((4, 1), dtype=np.float32))
+
+        audio = recorder.stop()
+
+        self.assertIs(audio.base, buffer)
+        np.testing.assert_array_equal(audio, np.ones(4, dtype=np.float32))
+        self.assertIsNone(recorder._ring)
+
+    def test_wrapped_recording_is_copied_out(self):
+        buffer = np.zeros(8, dtype=np.float32)
+        chunks = [np.full((4, 1), i, dtype=np.float32) for i in range(3)]
+        recorder = self._record(buffer, *chunks)
+
+        audio = recorder.stop()
+
+        self.assertIsNot(audio.base, buffer)
+        np.testing.assert_array_equal(audio, np.repeat([1, 2], 4).astype(np.float32))
+        self.assertIsNone(recorder._ring)
+
+
+class VolumeLevelTests(unittest.TestCase):
+    def test_levels_map_onto_unit_range(self):
+        recorder = AudioRecorder()
+        self.assertEqual(recorder.get_volume_level(np.zeros((0, 1), dtype=np.float32)), 0.0)
+        self.assertEqual(recorder.get_volume_level(np.zeros((8, 1), dtype=np.float32)), 0.0)
+        # -35 dB is halfway between -60 and -10 dB.
+        amplitude = 10 ** (-35 / 20)
+        chunk = np.full((8, 1), amplitude, dtype=np.float32)
+        self.assertAlmostEqual(recorder.get_volume_level(chunk), 0.5, places=4)
+        self.assertEqual(recorder.get_volume_level(np.ones((8, 1), dtype=np.float32)), 1.0)
+
+
+class DeviceQueryTests(unittest.TestCase):
+    def test_devices_enumerated_once(self):
+        devices = [
+            {"name": "Mic", "max_input_channels": 1},
+            {"name": "Speakers", "max_input_channels": 0},
+        ]
+        fake_sd = mock.Mock()
+        fake_sd.query_devices.return_value = devices
+        recorder_module._query_devices.cache_clear()
+        self.addCleanup(recorder_module._query_devices.cache_clear)
+        with mock.patch.object(recorder_module, "sd", fake_sd):
+            recorder = AudioRecorder()
+            self.assertTrue(recorder.is_available())
+            self.assertEqual(
+                recorder.get_devices(), [{"name": "Mic", "index": 0, "channels": 1}]
+            )
+        fake_sd.query_devices.assert_called_once_with()
+
+    def test_failed_enumeration_is_not_retried(self):
+        fake_sd = mock.Mock()
+        fake_sd.query_devices.side_effect = OSError("PortAudio not initialized")
+        recorder_module._query_devices.cache_clear()
+        self.addCleanup(recorder_module._query_devices.cache_clear)
+        with mock.patch.object(recorder_module, "sd", fake_sd):
+            recorder = AudioRecorder()
+            self.assertFalse(recorder.is_available())
+            self.assertEqual(recorder.get_devices(), [])
+        fake_sd.query_devices.assert_called_once_with()
+
+
+class AudioRecorderChunkTests(unittest.TestCase):
+    def test_live_chunks_read_from_ring(self):
+        recorder = AudioRecorder(RecorderConfig(blocksize=4, max_recording_seconds=1))
+        recorder._reset_buffers()
+        recorder._on_audio(np.full((4, 1), 7, dtype=np.float32), 4, None, None)
+
+        chunk = recorder.get_chunk(timeout=0)
+
+        np.testing.assert_array_equal(chunk, np.full(4, 7, dtype=np.float32))
+        self.assertIsNone(recorder.get_chunk(timeout=0.01))
+
+    def test_full_live_queue_drops_oldest(self):
+        recorder = AudioRecorder(
+            RecorderConfig(blocksize=4, max_recording_seconds=1, queue_maxsize=2)
+        )
+        recorder._reset_buffers()
+        for value in range(3):
+            recorder._on_audio(np.full((4, 1), value, dtype=np.float32), 4, None, None)
+
+        self.assertEqual(recorder.get_chunk(timeout=0)[0], 1)
+        self.assertEqual(recorder.get_chunk(timeout=0)[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from claude_stt import setup
+from claude_stt.config import Config
+
+
+class RunSetupTests(unittest.TestCase):
+    def _run(self, *argv, **overrides):
+        args = setup.build_parser().parse_args(["--no-start", "--no-precompile", *argv])
+        patches = {
+            "_check_python_version": mock.Mock(return_value=True),
+            "_validate_plugin_root": mock.Mock(return_value=True),
+            "_ensure_plugin_root_env": mock.Mock(),
+            "_ensure_config": mock.Mock(return_value=Config()),
+            "_check_platform_requirements": lambda: setup._print_warn("platform"),
+            "_check_audio": lambda: setup._print_info("audio") or True,
+            "_check_hotkey": lambda config, **kwargs: setup._print_info("hotkey") or True,
+            "_check_clipboard": lambda: setup._print_info("clipboard") or True,
+            "_ensure_engine_ready": (
+                lambda config, **kwargs: setup._print_info("engine") or True
+            ),
+        }
+        patches.update(overrides)
+        stdout = io.StringIO()
+        with contextlib.ExitStack() as stack:
+            for name, value in patches.items():
+                stack.enter_context(mock.patch.object(setup, name, value))
+            stack.enter_context(contextlib.redirect_stdout(stdout))
+            exit_code = setup.run_setup(args)
+        return exit_code, stdout.getvalue().splitlines()
+
+    def test_parallel_checks_print_in_order(self):
+        exit_code, lines = self._run()
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(
+            lines[:6],
+            [
+                "claude-stt setup starting.",
+                "Warning: platform",
+                "audio",
+                "hotkey",
+                "clipboard",
+                "engine",
+            ],
+        )
+
+    def test_serial_probes_run_in_order(self):
+        calls = []
+
+        def probe(name, result=True):
+            return lambda *args, **kwargs: calls.append(name) or result
+
+        exit_code, _ = self._run(
+            "--serial-probes",
+            _check_platform_requirements=probe("platform", None),
+            _check_audio=probe("audio"),
+            _check_hotkey=probe("hotkey"),
+            _check_clipboard=probe("clipboard"),
+            _ensure_engine_ready=probe("engine"),
+        )
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(calls, ["platform", "audio", "hotkey", "clipboard", "engine"])
+
+    def test_audio_failure_stops_before_hotkey(self):
+        hotkey = mock.Mock(return_value=True)
+        exit_code, lines = self._run(
+            _check_audio=lambda: setup._print_info("no audio") or False,
+            _check_hotkey=hotkey,
+        )
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(lines[-1], "no audio")
+        hotkey.assert_not_called()
+
+    def test_hotkey_failure_skips_engine_load(self):
+        engine = mock.Mock(return_value=True)
+        exit_code, lines = self._run(
+            _check_hotkey=lambda config, **kwargs: setup._print_info("no hotkey") or False,
+            _ensure_engine_ready=engine,
+        )
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(lines[-1], "no hotkey")
+        engine.assert_not_called()
+
+
+class PrecompileTests(unittest.TestCase):
+    def test_compile_failure_is_ignored(self):
+        with mock.patch("compileall.compile_dir", side_effect=OSError("read-only")):
+            with mock.patch.object(setup, "_print_info") as info:
+                setup._precompile_modules()
+        info.assert_not_called()
+
+    def test_reports_success(self):
+        with mock.patch("compileall.compile_dir", return_value=True) as compile_dir:
+            with mock.patch.object(setup, "_print_info") as info:
+                setup._precompile_modules()
+        compile_dir.assert_called_once_with(setup._PACKAGE_DIR, quiet=1)
+        info.assert_called_once_with("Precompiled bytecode.")
+
+
+class OutputBufferingTests(unittest.TestCase):
+    def test_flush_writes_each_stream_run_once(self):
+        def check():
+            setup._print_info("one")
+            setup._print_warn("two")
+            setup._print_error("three")
+            setup._print_info("four")
+            return "done"
+
+        stdout, stderr = mock.Mock(), mock.Mock()
+        captured = setup._captured(check)
+        with mock.patch.object(setup.sys, "stdout", stdout), mock.patch.object(
+            setup.sys, "stderr", stderr
+        ):
+            self.assertEqual(setup._flush(captured), "done")
+
+        self.assertEqual(
+            stdout.write.call_args_list,
+            [mock.call("one\nWarning: two\n"), mock.call("four\n")],
+        )
+        stderr.write.assert_called_once_with("Error: three\n")
+
+
+class ClipboardCheckTests(unittest.TestCase):
+    def _check(self, pyperclip):
+        with mock.patch.dict(sys.modules, {"pyperclip": pyperclip}), \
+            contextlib.redirect_stdout(io.StringIO()) as stdout:
+            return setup._check_clipboard(), stdout.getvalue()
+
+    def test_detected_backend_skips_round_trip(self):
+        pyperclip = mock.Mock()
+        pyperclip.determine_clipboard.return_value = (mock.Mock(), mock.Mock())
+
+        ok, _ = self._check(pyperclip)
+
+        self.assertTrue(ok)
+        pyperclip.copy.assert_not_called()
+        pyperclip.paste.assert_not_called()
+
+    def test_missing_backend_warns_without_round_trip(self):
+        pyperclip = mock.Mock()
+        pyperclip.determine_clipboard.return_value = (None, None)
+
+        ok, output = self._check(pyperclip)
+
+        self.assertFalse(ok)
+        self.assertIn("Clipboard backend unavailable", output)
+        pyperclip.copy.assert_not_called()
+
+
+class HotkeyCheckCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        os.environ["CLAUDE_STT_CONFIG_DIR"] = self._tmp.name
+        self.config = Config()
+
+    def tearDown(self):
+        os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+        self._tmp.cleanup()
+
+    def _check(self, force=False, strict=False, can_start=(True, None), expected=True):
+        with mock.patch("claude_stt.hotkey.HotkeyListener") as listener_cls, \
+            contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            listener_cls.return_value.can_start.return_value = can_start
+            listener_cls.return_value.start.return_value = True
+            self.assertEqual(
+                setup._check_hotkey(self.config, force=force, strict=strict), expected
+            )
+        return listener_cls
+
+    def test_recent_success_skips_listener(self):
+        self._check()
+        self.assertFalse(self._check().called)
+        self.assertTrue(self._check(force=True).called)
+
+    def test_listener_only_started_in_strict_mode(self):
+        listener = self._check().return_value
+        listener.start.assert_not_called()
+
+        listener = self._check(force=True, strict=True).return_value
+        listener.start.assert_called_once_with()
+        listener.stop.assert_called_once_with()
+
+    def test_failed_capability_check_fails_without_starting(self):
+        listener = self._check(can_start=(False, "no display"), expected=False).return_value
+        listener.start.assert_not_called()
+
+    def test_changed_hotkey_or_stale_marker_reruns_listener(self):
+        self._check()
+        self.config.hotkey = "ctrl+alt+r"
+        self.assertTrue(self._check().called)
+
+        with mock.patch.object(setup.time, "time", return_value=time.time() + 2 * 86400):
+            self.assertTrue(self._check().called)
+
+
+class EngineReadyCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        os.environ["CLAUDE_STT_CONFIG_DIR"] = self._tmp.name
+        self.config = Config()
+        self.engine = mock.Mock(spec=["model_name", "is_available", "load_model"])
+        self.engine.model_name = self.config.moonshine_model
+        self.engine.is_available.return_value = True
+        self.engine.load_model.return_value = True
+
+    def tearDown(self):
+        os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+        self._tmp.cleanup()
+
+    def _ensure(self, **kwargs):
+        with mock.patch(
+            "claude_stt.engine_factory.build_engine", return_value=self.engine
+        ), contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(
+                setup._ensure_engine_ready(self.config, skip_model_download=False, **kwargs)
+            )
+
+    def test_previous_load_is_trusted_until_revalidated(self):
+        self._ensure()
+        self._ensure()
+        self.assertEqual(self.engine.load_model.call_count, 1)
+
+        self._ensure(revalidate=True)
+        self.assertEqual(self.engine.load_model.call_count, 2)
+
+    def test_model_change_reloads(self):
+        self._ensure()
+        self.engine.model_name = "moonshine/tiny"
+        self._ensure()
+        self.assertEqual(self.engine.load_model.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from unittest import mock
+
+from claude_stt import sounds
+
+
+class SoundCommandTests(unittest.TestCase):
+    def setUp(self):
+        sounds._sound_command.cache_clear()
+        self.addCleanup(sounds._sound_command.cache_clear)
+
+    def test_command_resolved_once_per_event(self):
+        with mock.patch.object(sounds.platform, "system", return_value="Linux"), \
+            mock.patch.object(
+                sounds, "_linux_sound_command", return_value=["paplay", "start.oga"]
+            ) as resolve, \
+            mock.patch.object(sounds.subprocess, "Popen") as popen:
+            sounds.play_sound("start")
+            sounds.play_sound("start")
+
+        resolve.assert_called_once_with("start")
+        self.assertEqual(popen.call_count, 2)
+        self.assertEqual(popen.call_args[0][0], ["paplay", "start.oga"])
+
+    def test_missing_player_skips_spawn(self):
+        with mock.patch.object(sounds.platform, "system", return_value="Linux"), \
+            mock.patch.object(sounds, "_linux_sound_command", return_value=None), \
+            mock.patch.object(sounds.subprocess, "Popen") as popen:
+            sounds.play_sound("stop")
+        popen.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()